@@ -0,0 +1,77 @@
+"""채점 결과 분석: 영역별 정답률, 평균 편향(과대/과소 채점), 평균 절대 오차, 등급 혼동 행렬
+
+결과를 긴 형식 표(레코드 × 채점 영역마다 한 행)로 바꾼 뒤 numpy/pandas 연산으로 한 번에 계산한다.
+세션 하나의 결과든 여러 연습생의 결과를 이어 붙인 표든 같은 함수로 집계한다.
+
+    frame = records_frame(st.session_state.results, mode.dimensions, user="홍길동")
+    dimension_summary(frame)                       # 영역별
+    dimension_summary(frame, by=("user", "dimension"))  # 연습생 × 영역별
+    grade_confusion(frame)                         # 정답 등급 × 선택 등급
+"""
+import numpy as np
+import pandas as pd
+
+GRADES = (1, 2, 3, 4, 5)
+# 표시용 열 이름
+SUMMARY_LABELS = {
+    "count": "응답 수",
+    "hit_rate": "정답률(%)",
+    "bias": "평균 편향",
+    "mae": "평균 절대 오차",
+}
+
+
+def records_frame(records, dimensions, **columns):
+    """ResultRecord 목록을 긴 형식 DataFrame으로 (열: qnum, dimension, answer, response, hit)
+
+    columns로 넘긴 값은 모든 행에 같은 값으로 붙는다 (예: user="홍길동", mode="score").
+    """
+    records = list(records)
+    width = len(dimensions)
+    answers = np.array([r.answer for r in records], dtype=np.int16).reshape(-1, width)
+    responses = np.array([r.response for r in records], dtype=np.int16).reshape(-1, width)
+    hits = np.array([r.hits for r in records], dtype=bool).reshape(-1, width)
+    frame = pd.DataFrame({
+        "qnum": np.repeat(np.array([r.qnum for r in records], dtype=object), width),
+        "dimension": pd.Categorical(np.tile(np.array(dimensions, dtype=object), len(records)),
+                                    categories=list(dimensions)),
+        "answer": answers.ravel(),
+        "response": responses.ravel(),
+        "hit": hits.ravel(),
+    })
+    for key, value in columns.items():
+        frame[key] = value
+    return frame
+
+
+def dimension_summary(frame, by=("dimension",)):
+    """by 열 조합별 응답 수, 정답률(%), 평균 편향(응답 - 정답), 평균 절대 오차"""
+    error = frame["response"].to_numpy(np.int32) - frame["answer"].to_numpy(np.int32)
+    data = frame[list(by)].assign(
+        hit=frame["hit"].to_numpy(np.float64) * 100,
+        error=error,
+        abs_error=np.abs(error),
+    )
+    return data.groupby(list(by), observed=True, sort=True).agg(
+        count=("hit", "size"),
+        hit_rate=("hit", "mean"),
+        bias=("error", "mean"),
+        mae=("abs_error", "mean"),
+    )
+
+
+def grade_confusion(frame, labels=GRADES):
+    """정답 등급(행) × 선택한 등급(열) 응답 수 표 (labels 밖의 값은 세지 않는다)"""
+    labels = np.asarray(labels)
+    answers = frame["answer"].to_numpy()
+    responses = frame["response"].to_numpy()
+    valid = np.isin(answers, labels) & np.isin(responses, labels)
+    n = len(labels)
+    rows = np.searchsorted(labels, answers[valid])
+    cols = np.searchsorted(labels, responses[valid])
+    counts = np.bincount(rows * n + cols, minlength=n * n).reshape(n, n)
+    return pd.DataFrame(
+        counts,
+        index=pd.Index(labels, name="정답 등급"),
+        columns=pd.Index(labels, name="선택 등급"),
+    )
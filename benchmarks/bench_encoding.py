@@ -0,0 +1,74 @@
+"""문항 파일 디코딩 비용 비교: 요청마다 문자셋 추측 vs 확인한 인코딩 재사용 vs 미리 UTF-8로 변환
+
+    python benchmarks/bench_encoding.py
+
+- detect: requests의 response.text가 문자셋 헤더 없이 하는 것처럼 매번 charset_normalizer로 추측
+- try-order: decode_item_bytes(raw) — UTF-8 실패 후 CP949
+- cached: decode_item_bytes(raw, source) — 파일별로 기억한 인코딩으로 바로 디코딩
+- packed: item_pack이 미리 UTF-8로 변환해 둔 바이트 디코딩
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from charset_normalizer import detect  # noqa: E402
+
+import item_bank  # noqa: E402
+
+FOLDERS = ("data/grade", "data/scre")
+REPEAT = 5
+
+
+def _load_files():
+    files = []
+    for folder in FOLDERS:
+        folder_dir = os.path.join(item_bank.REPO_DIR, folder)
+        for name in sorted(os.listdir(folder_dir)):
+            if name.endswith(".txt"):
+                path = os.path.join(folder_dir, name)
+                with open(path, "rb") as f:
+                    files.append((path, f.read()))
+    return files
+
+
+def _detect_decode(raw):
+    encoding = detect(raw)["encoding"] or "utf-8"
+    return raw.decode(encoding, errors="replace")
+
+
+def _per_file_us(func, files, number):
+    def run():
+        for path, raw in files:
+            func(path, raw)
+    best = min(timeit.repeat(run, number=number, repeat=REPEAT))
+    return best / number / len(files) * 1e6
+
+
+def main():
+    files = _load_files()
+    utf8 = [(path, item_bank.decode_item_bytes(raw).encode("utf-8")) for path, raw in files]
+    for path, raw in files:
+        item_bank.decode_item_bytes(raw, path)
+
+    expected = [item_bank.decode_item_bytes(raw) for _, raw in files]
+    mismatched = sum(1 for (_, raw), text in zip(files, expected) if _detect_decode(raw) != text)
+
+    cases = [
+        ("detect", lambda path, raw: _detect_decode(raw), files, 5),
+        ("try-order", lambda path, raw: item_bank.decode_item_bytes(raw), files, 200),
+        ("cached", lambda path, raw: item_bank.decode_item_bytes(raw, path), files, 200),
+        ("packed", lambda path, raw: raw.decode("utf-8"), utf8, 200),
+    ]
+    print(f"문항 파일 {len(files)}개, 평균 {sum(len(r) for _, r in files) // len(files):,} 바이트")
+    baseline = None
+    for label, func, data, number in cases:
+        us = _per_file_us(func, data, number)
+        baseline = baseline or us
+        print(f"{label:>10}: {us:10.2f} µs/파일  (x{baseline / us:,.0f})")
+    print(f"detect 결과가 CP949/UTF-8 디코딩과 다른 파일: {mismatched}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""문항 읽기 경로 마이크로 벤치마크: 원격 읽기, 파싱, 폴더 목록, 묶음 파일, 프로세스 캐시
+
+    python benchmarks/bench_items.py                  # 15, 1000, 100000개로 측정하고 기준값과 비교
+    python benchmarks/bench_items.py --sizes 15 1000  # 일부 크기만
+    python benchmarks/bench_items.py --save           # 결과를 기준값(baseline_items.json)으로 저장
+
+저장소 문항 파일을 이름만 바꿔 N개로 늘린 고정 데이터를 임시 폴더와 로컬 HTTP 서버(가짜 GitHub)에 두고 잰다.
+
+- fetch/cold, fetch/warm: load_txt_from_url — 인코딩을 아직 모르는 URL vs 확인한 인코딩을 기억한 URL
+  (요청 수가 너무 많아지지 않도록 최대 FETCH_SAMPLE개만 읽는다)
+- parse/grade, parse/score: parse_item_txt — 등급/점수 문항 파일
+- list/cold, list/revalidate, list/warm: fetch_github_file_list — 200 응답(JSON 파싱),
+  TTL 만료 후 ETag 304, TTL 안의 캐시 적중 (항목 = 목록에 든 파일 이름)
+- pack/open, pack/record: item_pack — 묶음 파일 열기(헤더 파싱), 문항 하나씩 record()
+- cache/get_item: get_item — 프로세스 캐시(_ITEMS)에 이미 있는 문항
+
+지표: 항목당 지연(µs, REPEAT회 중 최소), 처리량(항목/초), tracemalloc으로 잰 항목당 최대 할당량과 남은 할당량(B)
+"""
+import argparse
+import http.server
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import item_bank  # noqa: E402
+import item_pack  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_items.json")
+SIZES = (15, 1000, 100000)
+REPEAT = 3
+FETCH_SAMPLE = 2000
+# 캐시/묶음 파일 경로와 겹치지 않는 가짜 폴더 이름
+BENCH_FOLDER = "bench/grade"
+
+
+class FixtureServer(http.server.BaseHTTPRequestHandler):
+    """고정 데이터를 내려주는 가짜 GitHub (contents API와 raw 파일, keep-alive)"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    files = {}
+    listing = b"[]"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=()):
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if "/contents/" in path:
+            if self.headers.get("If-None-Match") == '"fixture"':
+                self._send(304)
+            else:
+                self._send(200, self.listing, [("ETag", '"fixture"'), ("Content-Type", "application/json")])
+            return
+        body = self.files.get(path.rsplit("/", 1)[-1])
+        if body is None:
+            self._send(404)
+        else:
+            self._send(200, body)
+
+
+def _source_files():
+    """저장소 문항 파일 원본 바이트 {"grade": [...], "score": [...]}"""
+    sources = {}
+    for key, folder in (("grade", "data/grade"), ("score", "data/scre")):
+        folder_dir = os.path.join(item_bank.REPO_DIR, folder)
+        sources[key] = []
+        for name in sorted(os.listdir(folder_dir)):
+            if name.endswith(".txt"):
+                with open(os.path.join(folder_dir, name), "rb") as f:
+                    sources[key].append(f.read())
+    return sources
+
+
+def make_fixture(sources, n):
+    """원본 문항을 돌려 가며 N개로 늘린 {파일 이름: 바이트} (등급/점수 각각)"""
+    return {
+        key: {f"{i:06d}.txt": raws[i % len(raws)] for i in range(n)}
+        for key, raws in sources.items()
+    }
+
+
+def measure(func, items, repeat=REPEAT, setup=None):
+    """func()을 repeat회 실행해 (항목당 최소 µs, 항목/초, 항목당 최대 할당 B, 항목당 남은 할당 B)"""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return {
+        "us_per_item": round(best / items * 1e6, 3),
+        "items_per_s": round(items / best),
+        "peak_bytes_per_item": round((peak - before) / items),
+        "kept_bytes_per_item": round((current - before) / items),
+    }
+
+
+def bench_size(n, sources, base_url, workdir):
+    fixture = make_fixture(sources, n)
+    results = {}
+
+    # 원격 읽기: 인코딩을 모르는 URL(cold)과 확인한 URL(warm)
+    FixtureServer.files = fixture["grade"]
+    sample = list(fixture["grade"])[:FETCH_SAMPLE]
+    urls = [f"{base_url}/raw/{name}" for name in sample]
+
+    def forget_encodings():
+        for url in urls:
+            item_bank._ENCODINGS.pop(url, None)
+
+    def fetch():
+        return [item_bank.load_txt_from_url(url) for url in urls]
+
+    results["fetch/cold"] = measure(fetch, len(urls), setup=forget_encodings)
+    results["fetch/warm"] = measure(fetch, len(urls))
+
+    # 파싱: 디코딩한 줄 목록 -> Item
+    for key in ("grade", "score"):
+        lines = [(name, item_bank.decode_item_bytes(raw).splitlines()) for name, raw in fixture[key].items()]
+        results[f"parse/{key}"] = measure(
+            lambda lines=lines: [item_bank.parse_item_txt(ls, name) for name, ls in lines], n
+        )
+
+    # 폴더 목록: 200(JSON 파싱) / 만료 후 304 / TTL 안의 캐시 적중
+    FixtureServer.listing = json.dumps(
+        [{"name": name, "type": "file"} for name in fixture["grade"]]
+    ).encode()
+    key = ("bench", "bench", "main", BENCH_FOLDER)
+
+    def list_files():
+        return item_bank.fetch_github_file_list(*key)
+
+    def clear_listing():
+        item_bank._LISTINGS.pop(key, None)
+
+    def expire_listing():
+        _, etag, files = item_bank._LISTINGS[key]
+        item_bank._LISTINGS[key] = (0.0, etag, files)
+
+    results["list/cold"] = measure(list_files, n, setup=clear_listing)
+    results["list/revalidate"] = measure(list_files, n, setup=expire_listing)
+    results["list/warm"] = measure(list_files, n)
+
+    # 묶음 파일: 고정 데이터로 만든 파일 열기와 문항 record()
+    root = os.path.join(workdir, str(n))
+    for folder in item_pack.IMAGE_FOLDERS + item_pack.ITEM_FOLDERS:
+        os.makedirs(os.path.join(root, folder), exist_ok=True)
+    grade_dir = os.path.join(root, item_pack.ITEM_FOLDERS[0])
+    for name, raw in fixture["grade"].items():
+        with open(os.path.join(grade_dir, name), "wb") as f:
+            f.write(raw)
+    pack_path = os.path.join(root, "items.pack")
+    item_pack.build_pack(pack_path, root=root)
+    names = list(fixture["grade"])
+    folder = item_pack.ITEM_FOLDERS[0]
+    results["pack/open"] = measure(lambda: item_pack.open_pack(pack_path), n)
+    pack = item_pack.open_pack(pack_path)
+    results["pack/record"] = measure(lambda: [pack.record(folder, name) for name in names], n)
+
+    # 프로세스 캐시 적중
+    item_bank._ITEMS[BENCH_FOLDER] = {
+        name: item_bank.parse_item_txt(item_bank.decode_item_bytes(raw).splitlines(), name)
+        for name, raw in fixture["grade"].items()
+    }
+    results["cache/get_item"] = measure(
+        lambda: [item_bank.get_item(BENCH_FOLDER, name) for name in names], n
+    )
+    del item_bank._ITEMS[BENCH_FOLDER]
+    shutil.rmtree(root)
+    return results
+
+
+def _load_baseline():
+    try:
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            return json.load(f)["results"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="문항 수")
+    parser.add_argument("--save", action="store_true", help="결과를 기준값 파일에 저장")
+    args = parser.parse_args()
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FixtureServer)
+    threading.Thread(target=server.serve_forever, name="fixture-github", daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    item_bank.API_BASE_URL = base_url
+
+    sources = _source_files()
+    baseline = _load_baseline()
+    results = {}
+    workdir = tempfile.mkdtemp(prefix="sep-me-bench-")
+    try:
+        for n in args.sizes:
+            results[str(n)] = bench_size(n, sources, base_url, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+        server.shutdown()
+
+    for n, cases in results.items():
+        print(f"\n문항 {int(n):,}개")
+        print(f"  {'경로':<16}{'µs/항목':>12}{'항목/초':>14}{'최대 B/항목':>13}{'남은 B/항목':>13}{'기준 대비':>10}")
+        for case, row in cases.items():
+            base = baseline.get(n, {}).get(case)
+            ratio = f"x{row['us_per_item'] / base['us_per_item']:.2f}" if base else "-"
+            print(f"  {case:<16}{row['us_per_item']:>12.2f}{row['items_per_s']:>14,.0f}"
+                  f"{row['peak_bytes_per_item']:>13,.0f}{row['kept_bytes_per_item']:>13,.0f}{ratio:>10}")
+
+    if args.save:
+        saved = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "fetch_sample": FETCH_SAMPLE,
+            "results": {**_load_baseline(), **results},
+        }
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(saved, f, indent=1, ensure_ascii=False)
+            f.write("\n")
+        print(f"\n기준값 저장: {BASELINE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
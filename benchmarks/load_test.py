@@ -0,0 +1,359 @@
+"""연습 흐름 부하 시험: 가상 연습생 N명이 동시에 시작 → 과제 안내 → 연습 → 결과를 끝까지 진행한다
+
+    python benchmarks/load_test.py                            # appgrade.py, appscore.py 각각 20명
+    python benchmarks/load_test.py --users 50 --apps appscore.py
+    python benchmarks/load_test.py --latency 80               # 원격 응답마다 80ms 지연
+
+앱마다 `streamlit run` 서버를 하위 프로세스로 띄우고, 연습생마다 브라우저 대신 웹소켓 클라이언트 하나가
+Streamlit 프로토콜(BackMsg/ForwardMsg)로 위젯 값을 보내며 화면을 진행한다.
+문항 목록과 문항 파일은 저장소 data/를 내려주는 로컬 가짜 GitHub 서버에서 원격 모드로 읽는다.
+
+결과: 동작별 지연 시간 p50/p95/p99, 클릭당 스크립트 실행 수(화면을 그린 script_finished 수),
+앱 전체를 다시 실행한 비율(나머지는 fragment만 다시 실행, 예: 답안 입력/제출은 0%여야 한다),
+동작당 받은 바이트, 서버 프로세스 RSS(현재/최대), 가짜 서버가 받은 요청 수
+"""
+import argparse
+import http.server
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+DEFAULT_APPS = ("appgrade.py", "appscore.py")
+CHECKLIST_TAB = "🧠 상위인지 점검"
+# 스크립트 실행이 끝났음을 알리는 script_finished 상태 중 다음 실행이 이어지지 않는 것
+_FINAL_STATUSES = (0, 1, 3)  # FINISHED_SUCCESSFULLY, FINISHED_WITH_COMPILE_ERROR, FINISHED_FRAGMENT_RUN_SUCCESSFULLY
+_FRAGMENT_FINISHED = 3
+
+
+class StandInGitHub(http.server.BaseHTTPRequestHandler):
+    """GitHub contents API와 raw 파일 주소를 흉내 내는 로컬 서버 (저장소 파일을 그대로 내려준다)"""
+
+    latency = 0.0
+    requests = 0
+    _lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=()):
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with StandInGitHub._lock:
+            StandInGitHub.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        path = urlsplit(self.path).path
+        if "/contents/" in path:
+            # /repos/{owner}/{repo}/contents/{folder}
+            folder = path.split("/contents/", 1)[1]
+            if self.headers.get("If-None-Match") == '"stand-in"':
+                self._send(304)
+                return
+            try:
+                names = sorted(os.listdir(os.path.join(REPO_DIR, folder)))
+            except OSError:
+                self._send(404)
+                return
+            body = json.dumps([{"name": name, "type": "file"} for name in names]).encode()
+            self._send(200, body, [("ETag", '"stand-in"'), ("Content-Type", "application/json")])
+            return
+        try:
+            with open(os.path.join(REPO_DIR, path.lstrip("/")), "rb") as f:
+                body = f.read()
+        except OSError:
+            self._send(404)
+            return
+        self._send(200, body)
+
+
+def start_stand_in(latency_ms):
+    StandInGitHub.latency = latency_ms / 1000
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandInGitHub)
+    threading.Thread(target=server.serve_forever, name="stand-in-github", daemon=True).start()
+    return server
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_app(app, env):
+    """streamlit run 서버를 띄우고 응답할 때까지 기다린다 (프로세스, 포트)"""
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", app,
+         "--server.headless", "true", "--server.port", str(port),
+         "--browser.gatherUsageStats", "false"],
+        cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc, port
+        except OSError:
+            if proc.poll() is not None:
+                raise RuntimeError(proc.stderr.read().decode(errors="replace"))
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError(f"{app} 서버가 시작되지 않았습니다")
+
+
+def process_rss_mb(pid):
+    """프로세스의 (현재 RSS, 최대 RSS) MB"""
+    rss = peak = 0.0
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                rss = int(line.split()[1]) / 1024
+            elif line.startswith("VmHWM:"):
+                peak = int(line.split()[1]) / 1024
+    return rss, peak
+
+
+class BrowserSession:
+    """브라우저 탭 하나를 흉내 내는 웹소켓 클라이언트
+
+    화면에 그려진 위젯을 기억해 두고, 다시 실행을 요청할 때 지금 위젯 값 전체와
+    이번에 누른 버튼(trigger_value)을 함께 보낸다.
+    """
+
+    def __init__(self, port, timings):
+        from websockets.sync.client import connect
+
+        self._connection = connect(f"ws://127.0.0.1:{port}/_stcore/stream",
+                                   subprotocols=["streamlit"], max_size=None)
+        self.ws = self._connection.__enter__()
+        self.timings = timings
+        # 위젯 id -> (종류, proto, fragment_id) / 위젯 id -> 보낼 WidgetState
+        self.widgets = {}
+        self.states = {}
+
+    def close(self):
+        self._connection.__exit__(None, None, None)
+
+    def _collect(self, message):
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = ForwardMsg()
+        msg.ParseFromString(message)
+        kind = msg.WhichOneof("type")
+        if kind == "new_session" and not msg.new_session.fragment_ids_this_run:
+            self.widgets = {}
+        elif kind == "delta":
+            delta = msg.delta
+            if delta.WhichOneof("type") == "new_element":
+                element = delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "exception":
+                    raise RuntimeError(element.exception.message)
+                proto = getattr(element, element_type)
+                widget_id = getattr(proto, "id", "")
+                if widget_id:
+                    self.widgets[widget_id] = (element_type, proto, delta.fragment_id)
+            elif delta.WhichOneof("type") == "add_block" and delta.add_block.HasField("tab_container"):
+                block = delta.add_block.tab_container
+                self.widgets[block.id] = ("tab_container", block, delta.fragment_id)
+        return msg
+
+    def rerun(self, action, trigger=None, fragment_id=""):
+        """위젯 값(+ 누른 버튼)을 보내고 실행이 끝날 때까지 ForwardMsg를 받는다"""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        back = BackMsg()
+        back.rerun_script.query_string = ""
+        back.rerun_script.page_script_hash = ""
+        back.rerun_script.fragment_id = fragment_id
+        states = back.rerun_script.widget_states.widgets
+        for widget_id, state in self.states.items():
+            if widget_id in self.widgets:
+                states.append(state)
+        if trigger is not None:
+            state = WidgetState(id=trigger)
+            state.trigger_value = True
+            states.append(state)
+
+        runs = received = deltas = 0
+        start = time.perf_counter()
+        self.ws.send(back.SerializeToString())
+        while True:
+            message = self.ws.recv()
+            received += len(message)
+            msg = self._collect(message)
+            kind = msg.WhichOneof("type")
+            if kind == "delta":
+                deltas += 1
+            elif kind == "script_finished":
+                # 콜백의 st.rerun()으로 화면을 그리기 전에 끝난 실행(delta 없음)은 세지 않는다
+                if deltas or msg.script_finished in _FINAL_STATUSES:
+                    runs += 1
+                deltas = 0
+                if msg.script_finished in _FINAL_STATUSES:
+                    break
+        # 마지막 실행이 앱 전체 실행이었는지 (fragment만 다시 그렸으면 FINISHED_FRAGMENT_RUN_SUCCESSFULLY)
+        full = msg.script_finished != _FRAGMENT_FINISHED
+        self.timings.append((action, time.perf_counter() - start, runs, received, full))
+
+    def find(self, element_type, label=""):
+        """종류와 라벨 앞부분으로 위젯 찾기 (id, proto, fragment_id)"""
+        for widget_id, (kind, proto, fragment_id) in self.widgets.items():
+            if kind == element_type and getattr(proto, "label", "").startswith(label):
+                return widget_id, proto, fragment_id
+        raise RuntimeError(f"{element_type} 없음: {label}")
+
+    def has(self, element_type, label=""):
+        try:
+            self.find(element_type, label)
+        except RuntimeError:
+            return False
+        return True
+
+    def click(self, action, label):
+        widget_id, _, fragment_id = self.find("button", label)
+        self.rerun(action, trigger=widget_id, fragment_id=fragment_id)
+
+    def set_value(self, widget_id, field, value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        state = WidgetState(id=widget_id)
+        setattr(state, field, value)
+        self.states[widget_id] = state
+
+    def change(self, action, widget_id, field, value):
+        """위젯 값을 바꾸고 다시 실행 (fragment 안의 위젯이면 그 fragment만)"""
+        self.set_value(widget_id, field, value)
+        self.rerun(action, fragment_id=self.widgets[widget_id][2])
+
+
+def simulate_trainee(port, timings, questions, think_time):
+    """연습생 한 명이 시작부터 결과 화면까지 진행"""
+    browser = BrowserSession(port, timings)
+    try:
+        browser.rerun("open")
+        browser.set_value(browser.find("text_input")[0], "string_value", f"trainee-{id(browser):x}")
+        browser.set_value(browser.find("checkbox")[0], "bool_value", True)
+        browser.click("start", "시작하기")
+
+        if browser.has("tab_container"):
+            tabs_id = browser.find("tab_container")[0]
+            browser.change("guide_tab", tabs_id, "string_value", CHECKLIST_TAB)
+            for widget_id, (kind, _, _) in list(browser.widgets.items()):
+                if kind == "checkbox":
+                    browser.change("check", widget_id, "bool_value", True)
+            browser.click("begin", "🚀")
+
+        for _ in range(questions):
+            if browser.has("radio"):
+                widget_id, proto, _ = browser.find("radio")
+                browser.change("answer", widget_id, "string_value", random.choice(list(proto.options)))
+            else:
+                widget_id, proto, _ = browser.find("number_input")
+                value = random.randint(int(proto.min), int(proto.max))
+                browser.change("answer", widget_id, "double_value", value)
+            time.sleep(think_time)
+            browser.click("submit", "제출")
+            browser.click("next", "다음 문제로")
+    finally:
+        browser.close()
+
+
+def summarize(timings):
+    import numpy as np
+
+    rows = []
+    for action in dict.fromkeys(t[0] for t in timings):
+        selected = [t for t in timings if t[0] == action]
+        ms = np.array([t[1] for t in selected]) * 1000
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        runs = np.mean([t[2] for t in selected])
+        kb = np.mean([t[3] for t in selected]) / 1024
+        full = np.mean([t[4] for t in selected])
+        rows.append((action, len(selected), p50, p95, p99, ms.max(), runs, full, kb))
+    return rows
+
+
+def run_app(app, args, env):
+    proc, port = start_app(app, env)
+    try:
+        idle_rss, _ = process_rss_mb(proc.pid)
+        timings, errors = [], []
+        lock = threading.Lock()
+
+        def trainee(_):
+            local = []
+            try:
+                simulate_trainee(port, local, args.questions, args.think)
+            except Exception as e:
+                errors.append(e)
+            with lock:
+                timings.extend(local)
+
+        requests_before = StandInGitHub.requests
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.users) as pool:
+            list(pool.map(trainee, range(args.users)))
+        elapsed = time.perf_counter() - start
+        rss, peak = process_rss_mb(proc.pid)
+    finally:
+        proc.terminate()
+        proc.wait(10)
+
+    actions = sum(1 for t in timings if t[0] != "open")
+    print(f"\n{app}: {elapsed:.1f}초, 동작 {actions}회 ({actions / elapsed:.1f}회/초), 오류 {len(errors)}건, "
+          f"가짜 서버 요청 {StandInGitHub.requests - requests_before}건")
+    print(f"  서버 RSS: 시작 {idle_rss:.0f}MB → 종료 {rss:.0f}MB (최대 {peak:.0f}MB)")
+    for e in errors[:3]:
+        print(f"  오류: {e!r}")
+    print(f"  {'동작':<10}{'횟수':>6}{'p50':>10}{'p95':>10}{'p99':>10}{'최대':>10}{'실행/동작':>10}{'전체 실행':>9}{'KB/동작':>9}")
+    for action, count, p50, p95, p99, worst, runs, full, kb in summarize(timings):
+        print(f"  {action:<10}{count:>6}{p50:>8.1f}ms{p95:>8.1f}ms{p99:>8.1f}ms{worst:>8.1f}ms"
+              f"{runs:>10.2f}{full:>9.0%}{kb:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20, help="동시 연습생 수")
+    parser.add_argument("--apps", nargs="+", default=list(DEFAULT_APPS), help="시험할 앱 스크립트")
+    parser.add_argument("--questions", type=int, default=15, help="연습생마다 풀 문항 수")
+    parser.add_argument("--latency", type=float, default=0, help="가짜 서버 응답 지연(ms)")
+    parser.add_argument("--think", type=float, default=0, help="제출 전 생각하는 시간(초)")
+    args = parser.parse_args()
+
+    stand_in = start_stand_in(args.latency)
+    base = f"http://127.0.0.1:{stand_in.server_port}"
+    env = dict(
+        os.environ,
+        SEP_ME_ITEM_SOURCE="remote",
+        SEP_ME_RAW_BASE_URL=base,
+        SEP_ME_API_BASE_URL=base,
+        SEP_ME_RESPONSE_LOG=os.path.join(tempfile.mkdtemp(prefix="sep-me-load-"), "responses.sqlite3"),
+    )
+    print(f"연습생 {args.users}명 × {args.questions}문항, 가짜 서버 지연 {args.latency:g}ms")
+    for app in args.apps:
+        run_app(app, args, env)
+    stand_in.shutdown()
+
+
+if __name__ == "__main__":
+    main()
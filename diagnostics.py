@@ -0,0 +1,102 @@
+"""숨은 진단 화면: 추적이 켜져 있을 때 주소에 ?diagnostics=<키>를 붙이면 연습 화면 대신 보여 준다
+
+최근 실행 구간 분포, 최근 스크립트 실행의 구간 트리, 원격 호출 지연 시간, 캐시/기록 통계, 세션 상태 크기를 표시한다.
+"""
+import hmac
+import os
+import time
+
+import pandas as pd
+import streamlit as st
+
+import http_client
+import images
+import item_bank
+import response_log
+import session_size
+import tracing
+
+QUERY_PARAM = "diagnostics"
+# ?diagnostics= 값이 이 키와 같아야 화면을 보여 준다 (설정하지 않으면 화면을 열지 않는다)
+KEY = os.environ.get("SEP_ME_DIAGNOSTICS_KEY", "")
+
+
+def requested():
+    """추적이 켜져 있고 키가 설정되어 있으며 주소에 맞는 키로 진단 화면을 요청했으면 True"""
+    if not tracing.ENABLED or not KEY or QUERY_PARAM not in st.query_params:
+        return False
+    return hmac.compare_digest(st.query_params[QUERY_PARAM], KEY)
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2)
+
+
+def span_section():
+    st.markdown(f"### ⏱️ 구간별 지연 시간 (최근 {tracing.WINDOW_SLOTS * tracing.SLOT_SECONDS}초)")
+    summary = tracing.span_summary()
+    if not summary:
+        st.info("아직 기록된 구간이 없습니다.")
+        return
+    st.dataframe(pd.DataFrame.from_dict({
+        name: {
+            "횟수": row["count"],
+            "평균(ms)": _ms(row["mean"]),
+            "p50 이하(ms)": _ms(row["p50"]),
+            "p95 이하(ms)": _ms(row["p95"]),
+            "p99 이하(ms)": _ms(row["p99"]),
+        }
+        for name, row in summary.items()
+    }, orient="index").rename_axis("구간"))
+    st.caption("분위 값은 히스토그램 구간의 상한입니다.")
+
+
+def trace_section():
+    st.markdown("### 🌲 최근 스크립트 실행")
+    traces = tracing.recent_traces()
+    if not traces:
+        st.info("아직 끝난 실행이 없습니다.")
+        return
+    for started_at, entries in traces[:5]:
+        lines = [
+            f"{'  ' * depth}{name:<{28 - 2 * depth}} {_ms(elapsed):>9.2f} ms"
+            for depth, name, elapsed in entries
+            if elapsed is not None
+        ]
+        st.markdown(f"**{time.strftime('%H:%M:%S', time.localtime(started_at))}**")
+        st.code("\n".join(lines), language=None)
+
+
+def stats_section():
+    st.markdown("### 🌐 원격 호출")
+    hists = http_client.latency_histograms()
+    if hists:
+        st.dataframe(pd.DataFrame.from_dict({
+            host: {
+                "호출 수": hist["count"],
+                "실패 수": hist["errors"],
+                "평균(ms)": _ms(hist["sum"] / hist["count"]) if hist["count"] else 0.0,
+            }
+            for host, hist in hists.items()
+        }, orient="index").rename_axis("호스트"))
+    else:
+        st.info("원격 호출이 없었습니다.")
+
+    st.markdown("### 🗄️ 캐시, 응답 기록, 세션 상태")
+    st.json({
+        "폴더 목록 캐시": item_bank.listing_stats(),
+        "이미지 캐시": images.image_cache_stats(),
+        "응답 기록": response_log.log_stats(),
+        "세션 상태(바이트)": session_size.size_summary(),
+    })
+
+
+def run():
+    """진단 화면 (practice_engine.run에서 요청이 있을 때 호출)"""
+    st.title("🩺 진단")
+    if tracing.METRICS_PORT:
+        st.caption(f"Prometheus: http://{tracing.METRICS_HOST}:{tracing.METRICS_PORT}/metrics")
+    st.button("새로 고침")
+    span_section()
+    trace_section()
+    stats_section()
@@ -0,0 +1,120 @@
+"""연습1: 글의 등급 추정 모드"""
+import streamlit as st
+
+from practice_engine import PracticeMode
+
+# 등급 설명과 함께 보여 줄 선택지
+GRADE_OPTIONS = [
+    "1등급 - 최우수 (내용이 매우 충실하고 조직과 표현이 뛰어남)",
+    "2등급 - 우수 (내용이 충실하고 조직과 표현이 좋음)",
+    "3등급 - 보통 (내용이 적절하고 조직과 표현이 무난함)",
+    "4등급 - 미흡 (내용이 부족하고 조직과 표현에 문제가 있음)",
+    "5등급 - 매우 미흡 (내용이 매우 부족하고 조직과 표현이 불량함)"
+]
+
+# 등급별 상세 설명
+GRADE_DESCRIPTIONS = {
+    1: "1등급: 내용이 매우 충실하고, 조직이 체계적이며, 표현이 정확하고 효과적입니다.",
+    2: "2등급: 내용이 충실하고, 조직이 체계적이며, 표현이 대체로 정확합니다.",
+    3: "3등급: 내용이 적절하고, 조직이 대체로 체계적이며, 표현이 무난합니다.",
+    4: "4등급: 내용이 부족하고, 조직이 미흡하며, 표현에 문제가 있습니다.",
+    5: "5등급: 내용이 매우 부족하고, 조직이 불분명하며, 표현이 부정확합니다."
+}
+
+
+def _grade_number(choice):
+    """선택지 문구에서 등급 번호 추출"""
+    return int(choice.split("등급")[0])
+
+
+def render_input(idx):
+    """등급 선택 위젯 (선택한 등급 번호를 돌려준다)"""
+    st.markdown("#### 이 글의 등급을 선택하세요:")
+
+    choice = st.radio("예상 등급을 선택하세요:", GRADE_OPTIONS, key=f"grade_{idx}")
+
+    # 선택한 등급 번호 추출
+    return _grade_number(choice)
+
+
+def read_input(idx):
+    """세션 상태에 남아 있는 등급 선택값 (제출 콜백용)"""
+    return _grade_number(st.session_state.get(f"grade_{idx}", GRADE_OPTIONS[0]))
+
+
+def expected(item):
+    """정답 등급 (등급,)"""
+    return (item.answer,)
+
+
+def check(item, user_choice):
+    """등급 정답 여부 (정답,)"""
+    return (user_choice == item.answer,)
+
+
+def render_result(item, user_choice):
+    """등급 채점 결과 표시"""
+    st.markdown("#### 📊 채점 결과")
+    correct, = check(item, user_choice)
+
+    # 결과를 메트릭으로 표시
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("내가 선택한 등급", f"{user_choice}등급")
+
+    with col2:
+        st.metric("정답 등급", f"{item.answer}등급")
+
+    with col3:
+        if correct:
+            st.metric("결과", "정답", delta="✅")
+        else:
+            st.metric("결과", "오답", delta="❌")
+
+    # 전체 결과 판정
+    if correct:
+        st.success("🎉 정답입니다!")
+    else:
+        st.error("📚 오답입니다. 아래 피드백을 참고하세요.")
+        st.info(f"**정답 해설:** {GRADE_DESCRIPTIONS[item.answer]}")
+
+
+GRADE_MODE = PracticeMode(
+    key="grade",
+    folder="data/grade",
+    feedback_folder="data/f_grade",
+    page_title="SEP ME 6 - 등급 추정 모드",
+    title="📘 학생 글 채점 연습 프로그램 SEP ME 6 (등급 추정 모드)",
+    practice_title="✏️ [연습1] 글의 등급 추정하기",
+    result_title="📊 등급 추정 연습 결과 요약",
+    guide=True,
+    # 등급 추정용 상위인지 점검 체크리스트
+    checklist=[
+        "쓰기 과제의 내용과 요구사항을 충분히 이해했다",
+        "등급별 평가 기준과 특징을 숙지했다",
+        "1등급부터 5등급까지의 차이점을 파악했다",
+        "등급별 예시 글의 특징을 분석했다",
+        "학생 글을 객관적으로 평가할 준비가 되었다"
+    ],
+    guide_heading="### 🎯 등급 추정 연습 안내",
+    guide_info="""
+    **등급 추정 연습에서는:**
+    - 학생이 작성한 글을 읽고 전체적인 등급을 추정합니다
+    - **1등급 (최우수)부터 5등급 (미흡)까지** 5단계로 평가합니다
+    - 각 등급별 특징과 기준을 바탕으로 종합적으로 판단합니다
+    - 틀린 문항에 대해서는 상세한 피드백을 제공합니다
+    """,
+    dimensions=("등급",),
+    expected=expected,
+    check=check,
+    render_input=render_input,
+    read_input=read_input,
+    input_keys=("grade",),
+    render_result=render_result,
+    summary_messages=[
+        (80, "success", "🎉 우수한 성과입니다! 등급 추정 능력이 뛰어납니다."),
+        (60, "info", "👍 양호한 성과입니다. 조금 더 연습하면 더 좋아질 것입니다."),
+        (0, "warning", "📚 더 많은 연습이 필요합니다. 평가 기준을 다시 확인해보세요."),
+    ],
+)
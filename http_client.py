@@ -0,0 +1,157 @@
+"""원격 호출용 공용 HTTP 클라이언트: 연결 재사용, 시간 제한, 재시도, 지연 시간 히스토그램
+
+get() 한 번이 스크립트 스레드를 붙잡는 시간은 재시도를 모두 합쳐 대략 DEADLINE + 시도 한 번의 시간 제한으로 묶인다.
+"""
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+# 연결/응답 대기 시간 제한(초). 멈춘 연결이 스크립트 스레드를 붙잡지 않도록 한다
+CONNECT_TIMEOUT = float(os.environ.get("SEP_ME_HTTP_CONNECT_TIMEOUT", "3.05"))
+READ_TIMEOUT = float(os.environ.get("SEP_ME_HTTP_READ_TIMEOUT", "10"))
+# 재시도 횟수와 지수 백오프(무작위 지터 포함)
+MAX_RETRIES = int(os.environ.get("SEP_ME_HTTP_RETRIES", "3"))
+# 응답 대기 시간 초과 재시도 횟수 (READ_TIMEOUT을 재시도마다 다시 기다리므로 적게 둔다)
+READ_RETRIES = int(os.environ.get("SEP_ME_HTTP_READ_RETRIES", "1"))
+# get() 한 번의 마감(초). 지나면 남은 재시도 횟수와 상관없이 새 시도를 시작하지 않는다
+DEADLINE = float(os.environ.get("SEP_ME_HTTP_DEADLINE", "15"))
+BACKOFF_FACTOR = float(os.environ.get("SEP_ME_HTTP_BACKOFF", "0.3"))
+BACKOFF_JITTER = float(os.environ.get("SEP_ME_HTTP_BACKOFF_JITTER", "0.3"))
+# 429/503 응답의 Retry-After를 따를 때 기다리는 최대 시간(초). 길게 기다리면 스크립트 스레드가 멈춘다
+RETRY_AFTER_MAX = int(os.environ.get("SEP_ME_HTTP_RETRY_AFTER_MAX", "5"))
+# 호스트별 최대 동시 요청 수 (초과 요청은 POOL_TIMEOUT초까지 자리가 날 때를 기다린다)
+POOL_MAXSIZE = int(os.environ.get("SEP_ME_HTTP_POOL_MAXSIZE", "10"))
+POOL_TIMEOUT = float(os.environ.get("SEP_ME_HTTP_POOL_TIMEOUT", "5"))
+# 연결 풀을 유지할 호스트 수
+POOL_HOSTS = 4
+
+# 지연 시간 히스토그램 구간 상한(초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_session = None
+_LOCK = threading.Lock()
+# 호스트 -> 동시 요청 수 제한 세마포어
+_SLOTS = {}
+# 지금 스레드에서 진행 중인 get()의 마감 시각 (time.monotonic 기준)
+_deadline = threading.local()
+# 호스트 -> {"buckets": 구간별 개수(마지막은 +Inf), "count": 호출 수, "sum": 총 지연(초), "errors": 실패 수}
+_HISTOGRAMS = {}
+
+
+class _DeadlineRetry(Retry):
+    """get()이 정한 마감 전에 다음 시도를 시작할 수 없으면 재시도를 멈추는 Retry"""
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        deadline = getattr(_deadline, "at", None)
+        if deadline is not None:
+            wait = retry.get_backoff_time()
+            if response is not None and retry.respect_retry_after_header:
+                wait = max(wait, retry.get_retry_after(response) or 0)
+            if time.monotonic() + wait >= deadline:
+                # 상태 코드 재시도였으면 urllib3가 마지막 응답을 그대로 돌려준다 (raise_on_status=False)
+                raise MaxRetryError(_pool, url, error or ResponseError("재시도 마감 시간 초과"))
+        return retry
+
+
+def _new_session():
+    retry = _DeadlineRetry(
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        read=min(READ_RETRIES, MAX_RETRIES),
+        status=MAX_RETRIES,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        backoff_factor=BACKOFF_FACTOR,
+        backoff_jitter=BACKOFF_JITTER,
+        respect_retry_after_header=True,
+        retry_after_max=RETRY_AFTER_MAX,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_HOSTS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    """프로세스 전체가 공유하는 requests.Session (keep-alive 연결 풀)"""
+    global _session
+    if _session is None:
+        with _LOCK:
+            if _session is None:
+                _session = _new_session()
+    return _session
+
+
+def _observe(host, elapsed, failed):
+    with _LOCK:
+        hist = _HISTOGRAMS.get(host)
+        if hist is None:
+            hist = _HISTOGRAMS[host] = {
+                "buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+                "count": 0,
+                "sum": 0.0,
+                "errors": 0,
+            }
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if elapsed <= bound:
+                break
+        else:
+            i = len(LATENCY_BUCKETS)
+        hist["buckets"][i] += 1
+        hist["count"] += 1
+        hist["sum"] += elapsed
+        if failed:
+            hist["errors"] += 1
+
+
+def _slots(host):
+    slots = _SLOTS.get(host)
+    if slots is None:
+        with _LOCK:
+            slots = _SLOTS.setdefault(host, threading.BoundedSemaphore(POOL_MAXSIZE))
+    return slots
+
+
+def get(url, **kwargs):
+    """공용 세션으로 GET 요청 (기본 시간 제한과 마감 적용, 호스트별 지연 시간 기록)"""
+    kwargs.setdefault("timeout", (CONNECT_TIMEOUT, READ_TIMEOUT))
+    host = urlsplit(url).netloc
+    slots = _slots(host)
+    start = time.perf_counter()
+    failed = True
+    try:
+        # 호스트별 동시 요청이 다 차 있으면 POOL_TIMEOUT초까지만 기다린다
+        if not slots.acquire(timeout=POOL_TIMEOUT):
+            raise requests.exceptions.ConnectionError(f"{host}: 연결 대기 시간 초과 ({POOL_TIMEOUT}초)")
+        _deadline.at = time.monotonic() + DEADLINE
+        try:
+            response = get_session().get(url, **kwargs)
+        finally:
+            _deadline.at = None
+            slots.release()
+        failed = response.status_code >= 400
+        return response
+    finally:
+        _observe(host, time.perf_counter() - start, failed)
+
+
+def latency_histograms():
+    """호스트별 지연 시간 히스토그램 사본"""
+    with _LOCK:
+        return {
+            host: dict(hist, buckets=list(hist["buckets"]))
+            for host, hist in _HISTOGRAMS.items()
+        }
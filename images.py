@@ -0,0 +1,246 @@
+"""안내/피드백 이미지: 저장소의 data/ 이미지를 로컬에서 읽어 프로세스 메모리에 보관한다
+
+이미지는 문항 묶음 파일 → data/ 파일 순으로 찾고, 둘 다 없을 때만 원격 URL을 쓴다.
+st.image에 바이트를 넘기면 Streamlit이 내용 해시로 만든 /media 주소로 내려보내므로
+같은 이미지는 모든 재실행과 세션에서 같은 주소를 갖고, 브라우저가 GitHub CDN을 거치지 않는다.
+
+폭별 압축본(WebP, 선택적으로 AVIF)을 static/variants/에 만들어 두고 Streamlit 정적 파일 제공
+(server.enableStaticServing)이 켜져 있으면, 압축본 파일을 다시 인코딩하지 않고 <picture srcset>으로 보낸다.
+형식(AVIF/WebP)과 폭은 브라우저가 화면 폭과 지원 형식에 맞춰 고른다.
+압축본이나 정적 파일 제공이 없으면 원본 PNG/JPEG를 st.image로 보내고(Streamlit은 PNG/JPEG만 그대로 보낸다),
+원본 바이트는 크기 한도가 있는 LRU 캐시에 보관한다.
+
+    python images.py          # static/variants/ 에 WebP 압축본과 manifest.json 생성
+    python images.py --avif   # AVIF 압축본도 함께 생성
+"""
+import html
+import json
+import os
+import shutil
+import sys
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+import item_bank
+
+# Streamlit 정적 파일 폴더(앱 스크립트 옆 static/) 아래에 압축본을 두고 app/static/ 주소로 내려보낸다
+VARIANTS_DIR = "static/variants"
+VARIANTS_URL = "app/static/variants"
+MANIFEST_PATH = os.path.join(item_bank.REPO_DIR, VARIANTS_DIR, "manifest.json")
+# 압축본 폭(px)과 형식별 품질 (글자 위주인 PNG 원본은 WebP 무손실이 더 작다)
+VARIANT_WIDTHS = (480, 768, 1200)
+VARIANT_QUALITY = {"webp": 80, "avif": 60}
+# 브라우저가 먼저 고려할 형식 순서와 MIME 형식
+VARIANT_TYPES = (("avif", "image/avif"), ("webp", "image/webp"))
+LOSSLESS_EXTENSIONS = (".png",)
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+# 용량 비교용으로 가정하는 화면 폭(px) (휴대폰 약 390px × 2배 화면, PC 넓은 화면)
+MOBILE_WIDTH = 768
+DESKTOP_WIDTH = 1200
+
+# 이미지 캐시 최대 크기(바이트). 넘으면 가장 오래 쓰지 않은 이미지부터 버린다
+CACHE_BYTES = int(os.environ.get("SEP_ME_IMAGE_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+# 경로 -> 원본 바이트, 오래 쓰지 않은 순서 (모든 세션이 공유)
+_CACHE = OrderedDict()
+_cache_size = 0
+_CACHE_STATS = {"hits": 0, "misses": 0, "evictions": 0, "uncached": 0}
+_LOCK = threading.Lock()
+# 원본 경로 -> {"width", "height": 원본 크기(px), "bytes": 원본 바이트, "original": 원본 사본 경로,
+#               형식: [[폭, 압축본 경로, 크기], ...]} (경로는 VARIANTS_DIR 기준, 폭 오름차순)
+_manifest = None
+
+
+def _read_bytes(path):
+    pack = item_bank.get_pack()
+    data = pack.image(path) if pack is not None else None
+    if data is None:
+        try:
+            with open(os.path.join(item_bank.REPO_DIR, path), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+    return data
+
+
+def display_format(path):
+    """st.image에 넘길 형식 (원본 확장자 기준 "PNG" 또는 "JPEG")"""
+    return "PNG" if path.lower().endswith(".png") else "JPEG"
+
+
+def load_image_bytes(path):
+    """원본 이미지 바이트 (예: path="data/f_grade/7.png", 로컬에 없으면 None)"""
+    global _cache_size
+    with _LOCK:
+        data = _CACHE.get(path)
+        if data is not None:
+            _CACHE.move_to_end(path)
+            _CACHE_STATS["hits"] += 1
+            return data
+        _CACHE_STATS["misses"] += 1
+    data = _read_bytes(path)
+    if data is None:
+        return None
+    with _LOCK:
+        if len(data) > CACHE_BYTES:
+            # 한도보다 큰 이미지는 보관하지 않는다
+            _CACHE_STATS["uncached"] += 1
+            return data
+        if path not in _CACHE:
+            _CACHE[path] = data
+            _cache_size += len(data)
+        while _cache_size > CACHE_BYTES:
+            _, evicted = _CACHE.popitem(last=False)
+            _cache_size -= len(evicted)
+            _CACHE_STATS["evictions"] += 1
+        return _CACHE.get(path, data)
+
+
+def image_cache_stats():
+    """이미지 캐시 통계 (적중/실패/축출 수, 적중률, 보관 중인 이미지 수와 바이트)"""
+    with _LOCK:
+        stats = dict(_CACHE_STATS, items=len(_CACHE), bytes=_cache_size, limit=CACHE_BYTES)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+    return stats
+
+
+def _get_manifest():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except FileNotFoundError:
+            _manifest = {}
+    return _manifest
+
+
+def _variant_entry(path):
+    """정적 파일로 보낼 수 있는 압축본 정보 (정적 파일 제공이 꺼져 있거나 압축본이 없으면 None)"""
+    if not st.get_option("server.enableStaticServing"):
+        return None
+    return _get_manifest().get(path)
+
+
+def pick_variant(path, width, formats):
+    """브라우저가 고를 압축본과 같은 규칙: 지원 형식 순서대로 width 이상인 가장 좁은 압축본 (없으면 원본 사본)"""
+    entry = _get_manifest().get(path)
+    if not entry:
+        return None, 0
+    width = min(width, entry["width"])
+    for fmt in formats:
+        for variant_width, variant_path, size in entry.get(fmt, ()):
+            if variant_width >= width:
+                return variant_path, size
+    return entry["original"], entry["bytes"]
+
+
+def picture_html(entry, caption=None, stretch=False):
+    """압축본 파일을 그대로 가리키는 <picture> (브라우저가 형식과 폭을 고른다)"""
+    width, height = entry["width"], entry["height"]
+    sizes = "100vw" if stretch else f"min(100vw, {width}px)"
+    sources = "".join(
+        f'<source type="{mime}" sizes="{sizes}" srcset="'
+        + ", ".join(f"{VARIANTS_URL}/{rel} {w}w" for w, rel, _ in entry[fmt])
+        + '">'
+        for fmt, mime in VARIANT_TYPES
+        if entry.get(fmt)
+    )
+    style = "width:100%;height:auto" if stretch else "max-width:100%;height:auto"
+    img = (
+        f'<img src="{VARIANTS_URL}/{entry["original"]}" width="{width}" height="{height}"'
+        f' style="{style}" loading="lazy" decoding="async" alt="{html.escape(caption or "")}">'
+    )
+    figcaption = (
+        f'<figcaption style="text-align:center;font-size:0.875rem;opacity:0.6">{html.escape(caption)}</figcaption>'
+        if caption else ""
+    )
+    return f'<figure style="margin:0"><picture>{sources}{img}</picture>{figcaption}</figure>'
+
+
+def image_source(path):
+    """st.image에 넘길 값 (로컬 이미지가 있으면 원본 바이트, 없으면 원격 URL)"""
+    data = load_image_bytes(path)
+    if data is None:
+        return f"{item_bank.RAW_BASE_URL}/{path}"
+    return data
+
+
+def show_image(path, caption=None, width="content"):
+    """path 이미지 표시 (압축본이 있으면 그 파일을 그대로, 없으면 원본을 다시 인코딩하지 않고 st.image로)"""
+    entry = _variant_entry(path)
+    if entry is not None:
+        st.markdown(picture_html(entry, caption, stretch=width == "stretch"), unsafe_allow_html=True)
+        return
+    st.image(image_source(path), caption=caption, width=width, output_format=display_format(path))
+
+
+def build_variants(formats=("webp",)):
+    """data/ 아래 모든 이미지의 폭별 압축본, 원본 사본, manifest.json을 static/variants/에 만든다"""
+    from PIL import Image
+
+    manifest = {}
+    data_dir = os.path.join(item_bank.REPO_DIR, "data")
+    out_root = os.path.join(item_bank.REPO_DIR, VARIANTS_DIR)
+    shutil.rmtree(out_root, ignore_errors=True)
+    os.makedirs(out_root)
+    for root, dirs, files in os.walk(data_dir):
+        dirs[:] = sorted(dirs)
+        for name in sorted(files):
+            if not name.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            src = os.path.join(root, name)
+            path = os.path.relpath(src, item_bank.REPO_DIR).replace(os.sep, "/")
+            stem, ext = os.path.splitext(os.path.relpath(src, data_dir).replace(os.sep, "/"))
+            original_size = os.path.getsize(src)
+            lossless = name.lower().endswith(LOSSLESS_EXTENSIONS)
+            # 압축본을 지원하지 않는 브라우저용 원본 사본
+            original = f"{stem}{ext.lower()}"
+            os.makedirs(os.path.dirname(os.path.join(out_root, original)), exist_ok=True)
+            shutil.copyfile(src, os.path.join(out_root, original))
+            with Image.open(src) as im:
+                im = im.convert("RGBA" if "A" in im.getbands() else "RGB")
+                widths = [w for w in VARIANT_WIDTHS if w < im.width] + [im.width]
+                entry = manifest[path] = {
+                    "width": im.width, "height": im.height, "bytes": original_size, "original": original,
+                }
+                for fmt in formats:
+                    if fmt == "webp" and lossless:
+                        options = {"lossless": True, "method": 6}
+                    else:
+                        options = {"quality": VARIANT_QUALITY[fmt]}
+                    kept = []
+                    # 넓은 것부터 만들어, 더 넓은 압축본보다 크지 않은 것만 남긴다
+                    # (글자 이미지의 무손실 축소본은 원본 폭보다 오히려 커지기도 한다)
+                    smallest = original_size
+                    for w in reversed(widths):
+                        rel = f"{stem}.{w}.{fmt}"
+                        out = os.path.join(out_root, rel)
+                        h = round(im.height * w / im.width)
+                        resized = im if w == im.width else im.resize((w, h), Image.LANCZOS)
+                        resized.save(out, fmt.upper(), **options)
+                        size = os.path.getsize(out)
+                        if size >= smallest:
+                            os.remove(out)
+                            continue
+                        smallest = size
+                        kept.append([w, rel, size])
+                    entry[fmt] = kept[::-1]
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    global _manifest
+    _manifest = manifest
+    return manifest
+
+
+if __name__ == "__main__":
+    fmts = ("avif", "webp") if "--avif" in sys.argv[1:] else ("webp",)
+    built = build_variants(fmts)
+    original = sum(entry["bytes"] for entry in built.values())
+    print(f"{MANIFEST_PATH}: 이미지 {len(built)}개, 원본 {original:,} 바이트")
+    for label, width in (("PC", DESKTOP_WIDTH), ("휴대폰", MOBILE_WIDTH)):
+        sent = sum(pick_variant(p, width, fmts)[1] for p in built)
+        print(f"  {label} ({width}px): {sent:,} 바이트 ({sent / original:.0%})")
@@ -0,0 +1,5 @@
+"""SEP ME 6 - 교사용 현황"""
+from instructor_dashboard import run
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,185 @@
+"""교사용 현황 화면: 응답 기록의 누적 합계 표로 문항 난이도, 연습생별 정답률 추이, 영역별 채점 편향을 보여 준다
+
+원본 응답을 다시 읽지 않고 response_log가 기록할 때마다 갱신하는 합계 표만 읽으므로
+응답이 수십만 건이어도 화면을 그리는 비용은 문항 수와 연습생 수에만 비례한다.
+"""
+import hmac
+import os
+import sqlite3
+from urllib.request import pathname2url
+
+import pandas as pd
+import streamlit as st
+
+import response_log
+from analytics import GRADES, SUMMARY_LABELS
+from grade_mode import GRADE_MODE
+from score_mode import SCORE_MODE
+
+MODES = {mode.key: mode for mode in (GRADE_MODE, SCORE_MODE)}
+# 이 비밀번호를 입력해야 화면을 볼 수 있다 (설정하지 않으면 화면을 열지 않는다)
+PASSWORD = os.environ.get("SEP_ME_INSTRUCTOR_PASSWORD", "")
+# 1이면 비밀번호 없이 화면을 연다 (혼자 쓰는 로컬 실행용)
+OPEN_ACCESS = os.environ.get("SEP_ME_INSTRUCTOR_OPEN", "0") not in ("", "0")
+# 합계 표를 다시 읽는 간격(초)
+REFRESH_SECONDS = 10
+
+
+def _connect_readonly(path):
+    """읽기 전용 연결 (표 만들기와 합계 표 다시 만들기는 기록 스레드가 한다)"""
+    return sqlite3.connect(f"file:{pathname2url(os.path.abspath(path))}?mode=ro", uri=True, timeout=30)
+
+
+@st.cache_data(ttl=REFRESH_SECONDS, show_spinner=False)
+def load_totals(path, mode_key):
+    """모드 하나의 합계 표 (문항별, 문항×영역별, 연습생×날짜별, 혼동 행렬, 합계 표가 아직 없으면 None)"""
+    conn = _connect_readonly(path)
+    try:
+        # 기록 스레드가 아직 표를 만들지 않았거나 합계 표를 다시 만드는 중
+        if conn.execute("PRAGMA user_version").fetchone()[0] != response_log.AGGREGATE_VERSION:
+            return None
+        params = (mode_key,)
+        return {
+            "items": pd.read_sql_query(
+                "SELECT qnum, count, correct, latency_sum FROM item_totals WHERE mode = ?",
+                conn, params=params),
+            "dimensions": pd.read_sql_query(
+                "SELECT qnum, dimension, count, hits, error_sum, abs_error_sum"
+                " FROM dimension_totals WHERE mode = ?", conn, params=params),
+            "trainees": pd.read_sql_query(
+                "SELECT user_name, day, count, correct FROM trainee_totals WHERE mode = ?",
+                conn, params=params),
+            "confusion": pd.read_sql_query(
+                "SELECT answer, response, count FROM confusion_totals WHERE mode = ?",
+                conn, params=params),
+        }
+    finally:
+        conn.close()
+
+
+def _summary(totals):
+    """합계 열(count, hits, error_sum, abs_error_sum)을 정답률, 평균 편향, 평균 절대 오차로"""
+    count = totals["count"]
+    return pd.DataFrame({
+        "count": count,
+        "hit_rate": totals["hits"] / count * 100,
+        "bias": totals["error_sum"] / count,
+        "mae": totals["abs_error_sum"] / count,
+    }).rename(columns=SUMMARY_LABELS).round(2)
+
+
+def _check_password():
+    if not PASSWORD:
+        if OPEN_ACCESS:
+            return True
+        st.error(
+            "교사용 비밀번호가 설정되지 않았습니다. SEP_ME_INSTRUCTOR_PASSWORD를 설정하거나, "
+            "혼자 쓰는 로컬 실행이면 SEP_ME_INSTRUCTOR_OPEN=1로 실행하세요."
+        )
+        return False
+    entered = st.text_input("교사용 비밀번호", type="password")
+    if entered and hmac.compare_digest(entered, PASSWORD):
+        return True
+    if entered:
+        st.error("비밀번호가 맞지 않습니다.")
+    return False
+
+
+def item_section(totals):
+    items = totals["items"]
+    st.markdown("### 📚 문항별 난이도")
+    table = pd.DataFrame({
+        "문항": items["qnum"],
+        "응답 수": items["count"],
+        "정답률(%)": (items["correct"] / items["count"] * 100).round(1),
+        "평균 풀이 시간(초)": (items["latency_sum"] / items["count"]).round(1),
+    }).sort_values("정답률(%)").set_index("문항")
+    st.caption("정답률이 낮은(어려운) 문항부터 보여 줍니다.")
+    st.dataframe(table)
+    st.bar_chart(table["정답률(%)"])
+
+
+def dimension_section(mode, totals):
+    dimensions = totals["dimensions"]
+    names = dict(enumerate(mode.dimensions))
+    st.markdown("### 🎯 영역별 채점 편향")
+    by_dimension = dimensions.groupby("dimension")[["count", "hits", "error_sum", "abs_error_sum"]].sum()
+    by_dimension.index = by_dimension.index.map(names)
+    st.dataframe(_summary(by_dimension).rename_axis("영역"))
+    st.caption("평균 편향이 양수면 정답보다 높게, 음수면 낮게 채점하는 경향입니다.")
+
+    if len(mode.dimensions) > 1:
+        st.markdown("#### 문항 × 영역별 평균 편향")
+        bias = dimensions.assign(
+            영역=dimensions["dimension"].map(names),
+            bias=dimensions["error_sum"] / dimensions["count"],
+        ).pivot(index="qnum", columns="영역", values="bias")
+        st.dataframe(bias[list(mode.dimensions)].rename_axis("문항").round(2))
+
+    confusion = totals["confusion"]
+    if len(mode.dimensions) == 1 and not confusion.empty:
+        st.markdown("#### 등급 혼동 행렬 (행: 정답 등급, 열: 선택한 등급)")
+        matrix = (
+            confusion.pivot(index="answer", columns="response", values="count")
+            .reindex(index=GRADES, columns=GRADES, fill_value=0)
+            .fillna(0).astype(int)
+            .rename_axis(index="정답 등급", columns="선택 등급")
+        )
+        st.dataframe(matrix)
+
+
+def trainee_section(totals):
+    trainees = totals["trainees"]
+    st.markdown("### 🧑‍🎓 연습생별 정답률")
+    overall = trainees.groupby("user_name")[["count", "correct"]].sum()
+    table = pd.DataFrame({
+        "응답 수": overall["count"],
+        "정답률(%)": (overall["correct"] / overall["count"] * 100).round(1),
+    }).rename_axis("이름").sort_values("정답률(%)")
+    st.dataframe(table)
+
+    selected = st.multiselect("날짜별 추이를 볼 연습생", list(table.index), max_selections=10)
+    if selected:
+        trend = trainees[trainees["user_name"].isin(selected)].assign(
+            rate=lambda df: df["correct"] / df["count"] * 100
+        ).pivot(index="day", columns="user_name", values="rate")
+        st.line_chart(trend.sort_index())
+
+
+def run():
+    """교사용 현황 화면 진입점"""
+    st.set_page_config(page_title="SEP ME 6 - 교사용 현황", layout="wide")
+    st.title("📈 SEP ME 6 교사용 현황")
+
+    if not _check_password():
+        return
+    path = response_log.LOG_PATH
+    if not path or not os.path.exists(path):
+        st.info("아직 기록된 응답이 없습니다.")
+        return
+
+    key = st.radio(
+        "연습 모드", list(MODES), horizontal=True,
+        format_func=lambda k: MODES[k].practice_title,
+    )
+    mode = MODES[key]
+    totals = load_totals(path, key)
+    if totals is None:
+        st.info("합계 표가 아직 준비되지 않았습니다. 연습 앱이 다음 응답을 기록할 때 만들어집니다.")
+        return
+    items = totals["items"]
+    if items.empty:
+        st.info("이 모드로 기록된 응답이 없습니다.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("총 응답 수", int(items["count"].sum()))
+    with col2:
+        st.metric("연습생 수", totals["trainees"]["user_name"].nunique())
+    with col3:
+        st.metric("전체 정답률", f"{items['correct'].sum() / items['count'].sum() * 100:.1f}%")
+
+    item_section(totals)
+    dimension_section(mode, totals)
+    trainee_section(totals)
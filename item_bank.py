@@ -0,0 +1,338 @@
+"""문항 은행: 저장소에 포함된 data/ 문항 파일을 먼저 읽고, 없을 때만 GitHub에서 가져온다."""
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+import http_client
+import item_pack
+from tracing import traced
+
+logger = logging.getLogger(__name__)
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 원격 저장소 설정 (환경 변수로 변경 가능)
+GITHUB_OWNER = os.environ.get("SEP_ME_GITHUB_OWNER", "liisso")
+GITHUB_REPO = os.environ.get("SEP_ME_GITHUB_REPO", "sep-me-streamlit1")
+GITHUB_BRANCH = os.environ.get("SEP_ME_GITHUB_BRANCH", "main")
+RAW_BASE_URL = os.environ.get(
+    "SEP_ME_RAW_BASE_URL",
+    f"https://raw.githubusercontent.com/{GITHUB_OWNER}/{GITHUB_REPO}/{GITHUB_BRANCH}",
+)
+API_BASE_URL = os.environ.get("SEP_ME_API_BASE_URL", "https://api.github.com")
+# 인증 토큰이 있으면 시간당 호출 한도가 60회에서 5000회로 늘어난다
+GITHUB_TOKEN = os.environ.get("SEP_ME_GITHUB_TOKEN", "")
+# 폴더 목록 캐시 유효 시간(초). 만료 후에는 ETag로 재검증한다
+LISTING_TTL = float(os.environ.get("SEP_ME_LISTING_TTL", "300"))
+# 현재 문항을 보여주는 동안 미리 읽어 둘 다음 문항 수
+PREFETCH_DEPTH = int(os.environ.get("SEP_ME_PREFETCH_DEPTH", "2"))
+PREFETCH_WORKERS = 4
+# 연습 시작 시 문항 전체를 동시에 읽을 때의 최대 동시 요청 수
+WARMUP_CONCURRENCY = int(os.environ.get("SEP_ME_WARMUP_CONCURRENCY", "8"))
+
+# 문항 원본: "local" (로컬 우선) 또는 "remote" (항상 GitHub)
+ITEM_SOURCE = os.environ.get("SEP_ME_ITEM_SOURCE", "local")
+# 로컬 파일이 없을 때 GitHub에서 가져올지 여부
+REMOTE_FALLBACK = os.environ.get("SEP_ME_REMOTE_FALLBACK", "1") != "0"
+
+# 문항 파일 인코딩 (저장소의 파일은 CP949)
+ITEM_ENCODINGS = ("utf-8", "cp949")
+
+# 파싱된 문항 (등급 모드는 answer, 점수 모드는 content/organization/expression 사용)
+Item = namedtuple("Item", ["name", "qnum", "answer", "content", "organization", "expression", "text"])
+
+# 프로세스 전역 문항 캐시: folder -> {파일 이름: Item}
+_ITEMS = {}
+# 시작 시 로컬 문항을 모두 읽어 둔 폴더
+_PRELOADED = set()
+_LOCK = threading.Lock()
+# 백그라운드에서 읽고 있는 문항: (folder, 파일 이름) -> Future
+_PENDING = {}
+_executor = None
+# 메모리 매핑한 문항 묶음 파일 (python item_pack.py로 생성, 없으면 개별 파일 사용)
+_pack = None
+_pack_checked = False
+
+# folder -> 마지막으로 본 문항 파일 이름 튜플 (세션들이 색인으로 공유)
+_NAMES = {}
+
+# 원본(파일 경로 또는 URL)별로 확인한 인코딩
+_ENCODINGS = {}
+
+# 폴더 목록 캐시: (owner, repo, branch, folder) -> (만료 시각, ETag, 파일 목록)
+_LISTINGS = {}
+# 폴더 목록 캐시 통계 (not_modified: 304 응답, stale: 오류 시 이전 목록 사용)
+_LISTING_STATS = {"hits": 0, "misses": 0, "not_modified": 0, "errors": 0, "stale": 0}
+
+
+def decode_item_bytes(raw, source=None):
+    """문항 파일 바이트를 문자열로 변환 (source를 주면 확인한 인코딩을 기억해 다시 검사하지 않는다)"""
+    encoding = _ENCODINGS.get(source) if source is not None else None
+    if encoding is not None:
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            # 파일 내용이 바뀐 경우에만 다시 확인
+            pass
+    for encoding in ITEM_ENCODINGS:
+        try:
+            text = raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+        if source is not None:
+            _ENCODINGS[source] = encoding
+        return text
+    return raw.decode(ITEM_ENCODINGS[-1], errors="replace")
+
+
+@traced
+def load_txt_from_url(url):
+    response = http_client.get(url)
+    response.raise_for_status()
+    # response.text는 매번 문자셋을 추측하므로 바이트를 받아 직접 디코딩한다
+    return decode_item_bytes(response.content, url).splitlines()
+
+
+def _count_listing(key):
+    with _LOCK:
+        _LISTING_STATS[key] += 1
+
+
+def listing_stats():
+    """폴더 목록 캐시 통계 사본"""
+    with _LOCK:
+        return dict(_LISTING_STATS)
+
+
+@traced
+def fetch_github_file_list(owner, repo, branch, folder):
+    """GitHub 폴더 목록 (TTL 동안 캐시, 만료 후 ETag 재검증, 오류 시 이전 목록 사용)"""
+    key = (owner, repo, branch, folder)
+    cached = _LISTINGS.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        _count_listing("hits")
+        return list(cached[2])
+    _count_listing("misses")
+
+    url = f"{API_BASE_URL}/repos/{owner}/{repo}/contents/{folder}?ref={branch}"
+    headers = {"Accept": "application/vnd.github+json"}
+    if GITHUB_TOKEN:
+        headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+    if cached is not None and cached[1]:
+        headers["If-None-Match"] = cached[1]
+    try:
+        res = http_client.get(url, headers=headers)
+    except requests.RequestException as e:
+        res = None
+        logger.warning("GitHub API 호출 실패: %s", e)
+
+    if res is not None and res.status_code == 304 and cached is not None:
+        # 304 응답은 호출 한도에서 차감되지 않는다
+        _count_listing("not_modified")
+        files = cached[2]
+        etag = cached[1]
+    elif res is not None and res.status_code == 200:
+        files = tuple(f["name"] for f in res.json() if f["name"].endswith(".txt"))
+        etag = res.headers.get("ETag", "")
+    else:
+        if res is not None:
+            logger.warning("GitHub API 호출 실패: %s", res.status_code)
+        _count_listing("errors")
+        if cached is None:
+            return []
+        # 장애 중에도 세션마다 API를 다시 호출하지 않도록 이전 목록의 유효 시간을 연장
+        _count_listing("stale")
+        files = cached[2]
+        etag = cached[1]
+
+    with _LOCK:
+        _LISTINGS[key] = (time.monotonic() + LISTING_TTL, etag, files)
+    return list(files)
+
+
+def _use_local():
+    return ITEM_SOURCE != "remote"
+
+
+def _use_remote():
+    return ITEM_SOURCE == "remote" or REMOTE_FALLBACK
+
+
+def get_pack():
+    """로컬 문항 묶음 파일 (없거나 원격 모드이면 None)"""
+    global _pack, _pack_checked
+    if not _pack_checked:
+        with _LOCK:
+            if not _pack_checked:
+                if _use_local():
+                    try:
+                        _pack = item_pack.open_pack()
+                    except (OSError, ValueError) as e:
+                        logger.warning("문항 묶음 파일을 열 수 없습니다: %s", e)
+                _pack_checked = True
+    return _pack
+
+
+def list_item_files(folder):
+    """폴더 내 문항 파일 이름 목록 (예: folder="data/grade")"""
+    pack = get_pack()
+    if pack is not None and pack.has_folder(folder):
+        return pack.names(folder)
+    if _use_local():
+        local_dir = os.path.join(REPO_DIR, folder)
+        if os.path.isdir(local_dir):
+            files = sorted(f for f in os.listdir(local_dir) if f.endswith(".txt"))
+            if files:
+                return files
+    if _use_remote():
+        return fetch_github_file_list(GITHUB_OWNER, GITHUB_REPO, GITHUB_BRANCH, folder)
+    return []
+
+
+def item_names(folder):
+    """폴더의 문항 파일 이름 튜플 (목록이 그대로면 모든 세션이 같은 튜플 객체를 공유한다)"""
+    names = tuple(list_item_files(folder))
+    cached = _NAMES.get(folder)
+    if cached == names:
+        return cached
+    with _LOCK:
+        _NAMES[folder] = names
+    return names
+
+
+def load_item_lines(folder, name):
+    """문항 파일 한 개를 줄 단위로 읽기 (로컬 우선, 필요 시 원격)"""
+    if _use_local():
+        path = os.path.join(REPO_DIR, folder, name)
+        try:
+            with open(path, "rb") as f:
+                return decode_item_bytes(f.read(), path).splitlines()
+        except FileNotFoundError:
+            if not _use_remote():
+                raise
+    return load_txt_from_url(f"{RAW_BASE_URL}/{folder}/{name}")
+
+
+@traced
+def parse_item_txt(lines, name=""):
+    """문항 파일 파싱: 1행 문항 번호, 2행 등급, 3~5행 내용/조직/표현 점수, 6행부터 본문"""
+    if len(lines) < 6:
+        raise ValueError("파일 형식 오류: 6행 이상 필요")
+    return Item(
+        name=name,
+        qnum=lines[0].strip(),
+        answer=int(lines[1].strip()),
+        content=int(lines[2].strip()),
+        organization=int(lines[3].strip()),
+        expression=int(lines[4].strip()),
+        text="\n".join(lines[5:]).strip(),
+    )
+
+
+def _in_pack(folder):
+    pack = get_pack()
+    return pack is not None and pack.has_folder(folder)
+
+
+def _load_item(folder, name):
+    item = parse_item_txt(load_item_lines(folder, name), name)
+    with _LOCK:
+        return _ITEMS.setdefault(folder, {}).setdefault(name, item)
+
+
+@traced
+def get_item(folder, name):
+    """파싱된 문항 (프로세스당 한 번만 읽고 모든 세션이 공유)"""
+    if _in_pack(folder):
+        # 묶음 파일의 본문은 화면에 그릴 때만 디코딩하고 캐시에 두지 않는다
+        return Item(*get_pack().record(folder, name))
+    items = _ITEMS.get(folder)
+    if items is not None and name in items:
+        return items[name]
+    # 미리 읽기 중이면 새로 요청하지 않고 그 결과를 기다린다
+    future = _PENDING.get((folder, name))
+    if future is not None:
+        try:
+            return future.result()
+        except Exception:
+            pass
+    return _load_item(folder, name)
+
+
+@traced
+def get_item_meta(folder, name):
+    """채점용 문항 정보 (묶음 파일이면 본문을 디코딩하지 않고 text는 None)"""
+    if _in_pack(folder):
+        return Item(*get_pack().meta(folder, name), None)
+    return get_item(folder, name)
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _LOCK:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=PREFETCH_WORKERS, thread_name_prefix="item-prefetch"
+                )
+    return _executor
+
+
+def _prefetch_done(key, future):
+    with _LOCK:
+        _PENDING.pop(key, None)
+    if future.exception() is not None:
+        logger.warning("문항 미리 읽기 실패 %s: %s", key, future.exception())
+
+
+def prefetch_items(folder, names):
+    """캐시에 없는 문항을 백그라운드 스레드에서 미리 읽어 다음 실행에서 바로 쓰게 한다"""
+    if _in_pack(folder):
+        return
+    items = _ITEMS.get(folder, {})
+    for name in names:
+        key = (folder, name)
+        if name in items or key in _PENDING:
+            continue
+        executor = _get_executor()
+        with _LOCK:
+            if key in _PENDING:
+                continue
+            future = _PENDING[key] = executor.submit(_load_item, folder, name)
+        future.add_done_callback(lambda f, key=key: _prefetch_done(key, f))
+
+
+@traced
+def warm_items(folder, names, max_workers=None):
+    """캐시에 없는 문항을 동시에 읽어 두고 걸린 시간(초)을 돌려준다"""
+    start = time.perf_counter()
+    items = _ITEMS.get(folder, {})
+    missing = [] if _in_pack(folder) else [name for name in names if name not in items]
+    if missing:
+        workers = min(max_workers or WARMUP_CONCURRENCY, len(missing))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="item-warmup") as pool:
+            futures = [pool.submit(get_item, folder, name) for name in missing]
+        failed = sum(1 for f in futures if f.exception() is not None)
+        elapsed = time.perf_counter() - start
+        logger.info(
+            "문항 %d개 준비 (동시 %d, 실패 %d): %.3f초", len(missing), workers, failed, elapsed
+        )
+        return elapsed
+    return time.perf_counter() - start
+
+
+def preload_items(folder):
+    """로컬 문항이 있으면 시작 시 모두 읽어 프로세스 캐시(_ITEMS)에 올린다 (원격은 필요할 때 읽음)"""
+    if folder in _PRELOADED or _in_pack(folder):
+        # 묶음 파일은 열 때 메타데이터가 모두 올라오므로 따로 준비할 것이 없다
+        return
+    if _use_local() and os.path.isdir(os.path.join(REPO_DIR, folder)):
+        for name in list_item_files(folder):
+            get_item(folder, name)
+    with _LOCK:
+        _PRELOADED.add(folder)
@@ -0,0 +1,163 @@
+"""문항 묶음 파일(data/items.pack) 만들기와 읽기
+
+data/grade, data/scre의 문항과 data/f_grade, data/f_score의 피드백 이미지를
+파일 하나로 묶는다. 앱은 이 파일을 한 번 열어 메모리 매핑으로 읽는다.
+
+    python item_pack.py            # data/items.pack 생성
+    python item_pack.py out.pack   # 다른 경로에 생성
+
+파일 구조:
+    MAGIC(8바이트) | 헤더 길이(uint32 LE) | 헤더(JSON, UTF-8) | 본문
+헤더에는 폴더별 열(column) 목록(파일 이름, 문항 번호, 등급, 내용, 조직, 표현, 본문 위치, 본문 길이)과
+이미지별 [본문 위치, 길이]가 들어 있고, 본문에는 UTF-8로 변환한 글과 이미지 바이트가 이어 붙어 있다.
+읽을 때는 숫자 열만 array로 메모리에 두고, 글은 요청할 때마다 매핑된 본문에서 디코딩한다.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+PACK_PATH = os.environ.get("SEP_ME_ITEM_PACK", os.path.join(REPO_DIR, "data", "items.pack"))
+
+MAGIC = b"SEPPACK1"
+VERSION = 2
+ITEM_FOLDERS = ("data/grade", "data/scre")
+IMAGE_FOLDERS = ("data/f_grade", "data/f_score")
+
+_PREFIX = struct.Struct("<8sI")
+# 숫자 열과 array 형식 (점수는 0~255, 본문 위치는 64비트)
+_COLUMNS = (
+    ("answer", "B"), ("content", "B"), ("organization", "B"), ("expression", "B"),
+    ("offset", "Q"), ("length", "I"),
+)
+
+
+def build_pack(path=PACK_PATH, root=REPO_DIR):
+    """root의 data/ 아래 문항과 피드백 이미지를 묶어 path에 저장하고 문항 수를 돌려준다"""
+    from item_bank import decode_item_bytes, parse_item_txt
+
+    header = {"version": VERSION, "folders": {}, "images": {}}
+    body = bytearray()
+    count = 0
+    for folder in ITEM_FOLDERS:
+        columns = {"names": [], "qnums": []}
+        columns.update((key, []) for key, _ in _COLUMNS)
+        folder_dir = os.path.join(root, folder)
+        for name in sorted(f for f in os.listdir(folder_dir) if f.endswith(".txt")):
+            with open(os.path.join(folder_dir, name), "rb") as f:
+                item = parse_item_txt(decode_item_bytes(f.read()).splitlines(), name)
+            text = item.text.encode("utf-8")
+            columns["names"].append(name)
+            columns["qnums"].append(item.qnum)
+            columns["answer"].append(item.answer)
+            columns["content"].append(item.content)
+            columns["organization"].append(item.organization)
+            columns["expression"].append(item.expression)
+            columns["offset"].append(len(body))
+            columns["length"].append(len(text))
+            body += text
+        header["folders"][folder] = columns
+        count += len(columns["names"])
+    for folder in IMAGE_FOLDERS:
+        folder_dir = os.path.join(root, folder)
+        for name in sorted(os.listdir(folder_dir)):
+            with open(os.path.join(folder_dir, name), "rb") as f:
+                data = f.read()
+            header["images"][f"{folder}/{name}"] = [len(body), len(data)]
+            body += data
+
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, len(header_bytes)))
+        f.write(header_bytes)
+        f.write(body)
+    os.replace(tmp_path, path)
+    return count
+
+
+class _FolderTable:
+    """폴더 하나의 문항 메타데이터 (숫자 열은 array로 보관)"""
+
+    __slots__ = ("names", "qnums", "positions") + tuple(key for key, _ in _COLUMNS)
+
+    def __init__(self, columns):
+        self.names = columns["names"]
+        self.qnums = columns["qnums"]
+        self.positions = {name: i for i, name in enumerate(self.names)}
+        for key, typecode in _COLUMNS:
+            setattr(self, key, array(typecode, columns[key]))
+
+
+class ItemPack:
+    """메모리 매핑한 문항 묶음 파일"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_len = _PREFIX.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"문항 묶음 파일 형식 오류: {path}")
+        header = json.loads(self._mm[_PREFIX.size:_PREFIX.size + header_len])
+        if header["version"] != VERSION:
+            raise ValueError(
+                f"지원하지 않는 문항 묶음 버전: {header['version']} (python item_pack.py로 다시 만드세요)"
+            )
+        self._base = _PREFIX.size + header_len
+        self._folders = {
+            folder: _FolderTable(columns) for folder, columns in header["folders"].items()
+        }
+        self._images = header["images"]
+
+    def _slice(self, offset, length):
+        start = self._base + offset
+        return self._mm[start:start + length]
+
+    def has_folder(self, folder):
+        return folder in self._folders
+
+    def names(self, folder):
+        table = self._folders.get(folder)
+        return list(table.names) if table is not None else []
+
+    def meta(self, folder, name):
+        """본문을 제외한 (파일 이름, 문항 번호, 등급, 내용, 조직, 표현) 튜플"""
+        table = self._folders[folder]
+        i = table.positions[name]
+        return (
+            name, table.qnums[i], table.answer[i],
+            table.content[i], table.organization[i], table.expression[i],
+        )
+
+    def text(self, folder, name):
+        """본문을 매핑된 영역에서 바로 디코딩 (메모리에 보관하지 않음)"""
+        table = self._folders[folder]
+        i = table.positions[name]
+        return self._slice(table.offset[i], table.length[i]).decode("utf-8")
+
+    def record(self, folder, name):
+        """(파일 이름, 문항 번호, 등급, 내용, 조직, 표현, 본문) 튜플"""
+        return self.meta(folder, name) + (self.text(folder, name),)
+
+    def image(self, path):
+        """묶음에 들어 있는 이미지 바이트 (예: "data/f_grade/7.png", 없으면 None)"""
+        entry = self._images.get(path)
+        if entry is None:
+            return None
+        return self._slice(*entry)
+
+
+def open_pack(path=PACK_PATH):
+    """문항 묶음 파일 열기 (파일이 없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    return ItemPack(path)
+
+
+if __name__ == "__main__":
+    out = sys.argv[1] if len(sys.argv) > 1 else PACK_PATH
+    n = build_pack(out)
+    print(f"{out}: 문항 {n}개, {os.path.getsize(out):,} 바이트")
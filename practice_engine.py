@@ -0,0 +1,481 @@
+"""SEP ME 채점 연습 공용 엔진
+
+시작 → (과제 안내) → 연습 → 결과 흐름, 세션 상태, 문항 불러오기를 한곳에서 처리한다.
+등급 추정/점수 추정처럼 모드마다 다른 부분은 PracticeMode에 담아 넘긴다.
+
+    from grade_mode import GRADE_MODE
+    from practice_engine import run
+
+    run(GRADE_MODE)                         # 과제 안내 포함
+    run(GRADE_MODE._replace(guide=False))   # 과제 안내 없이 바로 연습
+"""
+import random
+import time
+from array import array
+from collections import namedtuple
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import diagnostics
+import profiling
+import session_size
+import tracing
+from analytics import SUMMARY_LABELS, dimension_summary, grade_confusion, records_frame
+from images import show_image
+from item_bank import (
+    PREFETCH_DEPTH, get_item, get_item_meta, item_names, prefetch_items, preload_items, warm_items,
+)
+from response_log import log_response
+from results import ResultRecord, ResultStore
+from tracing import span, traced
+
+# 모드별 설정과 화면 구성 요소
+#   key: 모드 이름 ("grade", "score")
+#   folder / feedback_folder: 문항 폴더, 오답 피드백 이미지 폴더
+#   page_title, title, practice_title, result_title: 화면 제목
+#   guide: 과제 안내 화면 사용 여부
+#   checklist: 상위인지 점검 항목
+#   guide_heading, guide_info: 과제 안내 화면 하단의 모드 안내
+#   dimensions: 채점 영역 이름 (예: ("내용", "조직", "표현"))
+#   expected(item): 영역별 정답 튜플
+#   check(item, response): 영역별 정답 여부 튜플
+#   render_input(idx): 답안 입력 위젯을 그리고 현재 입력값을 돌려준다
+#   read_input(idx): 세션 상태에 남아 있는 입력 위젯 값을 돌려준다 (제출 콜백에서 사용)
+#   input_keys: 답안 입력 위젯 키 접두어 (위젯 키는 f"{접두어}_{idx}")
+#   render_result(item, response): 채점 결과를 그린다
+#   summary_messages: 정답률 구간별 메시지 [(최소 정답률, "success"/"info"/"warning", 문구), ...]
+PracticeMode = namedtuple("PracticeMode", [
+    "key", "folder", "feedback_folder",
+    "page_title", "title", "practice_title", "result_title",
+    "guide", "checklist", "guide_heading", "guide_info",
+    "dimensions", "expected", "check",
+    "render_input", "read_input", "input_keys", "render_result", "summary_messages",
+])
+
+START, GUIDE, PRACTICE, RESULT = "start", "guide", "practice", "result"
+
+# 문항마다 새로 만드는 버튼의 키 접두어와 상위인지 점검 체크박스 키 접두어
+ITEM_BUTTON_KEYS = ("submit", "next")
+CHECKLIST_KEYS = ("meta",)
+
+
+def _step_names(mode):
+    return [START, GUIDE, PRACTICE, RESULT] if mode.guide else [START, PRACTICE, RESULT]
+
+
+def goto(mode, name):
+    """이름으로 단계 이동"""
+    st.session_state.step = _step_names(mode).index(name)
+
+
+# 버튼 콜백: 버튼을 누르면 스크립트가 다시 실행되기 전에 상태를 먼저 바꿔서
+# 클릭 한 번이 스크립트 실행 한 번으로 끝나게 한다 (콜백 안의 st.rerun()은 실행 범위만 정하고 실행을 더하지 않는다,
+# 클릭당 실행 수는 benchmarks/load_test.py의 "실행/동작" 열로 확인)
+def _on_goto(mode, name):
+    if name == PRACTICE:
+        # 점검 결과는 checklist에 남아 있으므로 체크박스 키는 버린다
+        _prune_widget_keys(CHECKLIST_KEYS)
+    goto(mode, name)
+
+
+def _on_start(mode):
+    st.session_state.user_name = st.session_state.name_input
+    st.session_state.agreed = st.session_state.agreed_input
+    if st.session_state.user_name.strip() and st.session_state.agreed:
+        goto(mode, GUIDE if mode.guide else PRACTICE)
+
+
+def _on_submit(mode, idx):
+    response = mode.read_input(idx)
+    # 채점에는 정답만 필요하므로 본문은 읽지 않는다
+    item = get_item_meta(mode.folder, _item_name(idx))
+    record = ResultRecord(
+        item.qnum,
+        mode.expected(item),
+        response if isinstance(response, tuple) else (response,),
+        mode.check(item, response),
+        st.session_state.item_started,
+        time.time(),
+    )
+    if st.session_state.results.add(record):
+        # 파일 쓰기는 백그라운드에서 (제출 처리 시간에 더하지 않는다)
+        log_response(st.session_state.user_name, mode.key, record)
+    st.session_state.response = response
+    st.session_state.submitted = True
+
+
+def _on_next(mode):
+    st.session_state.item_index += 1
+    st.session_state.item_started = time.time()
+    st.session_state.submitted = False
+    st.session_state.response = None
+    _prune_widget_keys(_item_keys(mode), keep=st.session_state.item_index)
+    if st.session_state.item_index >= st.session_state.num_questions:
+        goto(mode, RESULT)
+    # 버튼이 answer_panel 안에 있으므로 이 클릭을 앱 전체 실행으로 바꾼다 (실행은 한 번)
+    st.rerun()
+
+
+def _on_restart(mode):
+    # 연습 관련 상태만 초기화
+    goto(mode, PRACTICE)
+    _reset_practice()
+    _prune_widget_keys(_item_keys(mode))
+
+
+def _on_exit(mode):
+    reset_state()
+    _prune_widget_keys(_item_keys(mode) + CHECKLIST_KEYS)
+
+
+def _item_keys(mode):
+    return tuple(mode.input_keys) + ITEM_BUTTON_KEYS
+
+
+def _prune_widget_keys(prefixes, keep=None):
+    """f"{접두어}_{번호}" 형식의 위젯 키 중 번호가 keep이 아닌 것을 세션 상태에서 지운다"""
+    for key in list(st.session_state.keys()):
+        prefix, _, number = key.rpartition("_")
+        if prefix in prefixes and number.isdigit() and int(number) != keep:
+            del st.session_state[key]
+
+
+def _item_name(idx):
+    """이번 연습 idx번째 문항의 파일 이름"""
+    return st.session_state.item_names[st.session_state.item_order[idx]]
+
+
+def _reset_practice():
+    """연습 관련 상태 초기화
+
+    문항은 모든 세션이 공유하는 파일 이름 튜플(item_names)과 그 안의 색인 배열(item_order)로만 가리킨다.
+    """
+    st.session_state.item_names = ()
+    st.session_state.item_order = array("I")
+    st.session_state.item_index = 0
+    st.session_state.item_started = None
+    st.session_state.results = ResultStore()
+    st.session_state.submitted = False
+    st.session_state.response = None
+
+
+def initialize_session_state():
+    """세션 상태 초기화 함수"""
+    if 'step' not in st.session_state:
+        st.session_state.step = 0
+    if 'num_questions' not in st.session_state:
+        st.session_state.num_questions = 15
+    if 'item_order' not in st.session_state:
+        _reset_practice()
+    if 'user_name' not in st.session_state:
+        st.session_state.user_name = ""
+    if 'agreed' not in st.session_state:
+        st.session_state.agreed = False
+    if 'checklist' not in st.session_state:
+        st.session_state.checklist = {}
+
+
+def reset_state():
+    """앱 재시작을 위한 상태 초기화"""
+    st.session_state.step = 0
+    st.session_state.num_questions = 15
+    _reset_practice()
+    st.session_state.user_name = ""
+    st.session_state.agreed = False
+    st.session_state.checklist = {}
+
+
+@traced
+def start_screen(mode):
+    st.title(mode.title)
+
+    name = st.text_input("이름을 입력하세요", value=st.session_state.user_name, key="name_input")
+    agreed = st.checkbox("개인정보 수집 및 이용에 동의합니다.",
+                         value=st.session_state.agreed, key="agreed_input")
+
+    # 입력값을 세션 상태에 저장
+    st.session_state.user_name = name
+    st.session_state.agreed = agreed
+
+    # 조건을 채웠으면 콜백에서 이미 다음 단계로 넘어갔으므로 여기서는 안내만 한다
+    if st.button("시작하기", on_click=_on_start, args=(mode,)):
+        if not name.strip():
+            st.warning("이름을 입력해야 시작할 수 있습니다.")
+        elif not agreed:
+            st.warning("개인정보 동의가 필요합니다.")
+
+
+@traced
+def guide_screen(mode):
+    """📋 과제 및 평가 기준 안내 화면"""
+    st.title("📋 쓰기 과제 및 평가 기준 안내")
+
+    st.markdown("### 연습을 시작하기 전에 아래 내용을 확인해주세요!")
+
+    # 탭으로 구성 (선택한 탭만 그려서 보이지 않는 탭의 이미지는 보내지 않는다)
+    tab1, tab2, tab3, tab4 = st.tabs(
+        ["📝 쓰기 과제", "📊 평가 기준", "📚 등급별 예시", "🧠 상위인지 점검"],
+        key="guide_tab", on_change="rerun",
+    )
+
+    with tab1:
+        if tab1.open:
+            st.markdown("#### 📝 쓰기 과제")
+            try:
+                show_image("data/assignment.png",
+                           caption="쓰기 과제 안내", width="stretch")
+            except:
+                st.error("과제 안내 이미지를 불러올 수 없습니다.")
+
+    with tab2:
+        if tab2.open:
+            st.markdown("#### 📊 평가 기준")
+            try:
+                show_image("data/standard.png",
+                           caption="평가 기준 안내", width="stretch")
+            except:
+                st.error("평가 기준 이미지를 불러올 수 없습니다.")
+
+    with tab3:
+        if tab3.open:
+            st.markdown("#### 📚 등급별 예시 글")
+            try:
+                show_image("data/prompt.jpg",
+                           caption="등급별 예시 글", width="stretch")
+            except:
+                st.error("예시 글 이미지를 불러올 수 없습니다.")
+
+    # 점검 결과는 탭을 옮겨도 남도록 세션 상태에 보관 (체크박스는 닫힌 탭에서 그려지지 않는다)
+    checked_items = [st.session_state.checklist.get(i, False) for i in range(len(mode.checklist))]
+
+    with tab4:
+        if tab4.open:
+            st.markdown("#### 🧠 상위인지 점검")
+            st.markdown("**연습을 시작하기 전에 다음 항목들을 확인해보세요:**")
+
+            # 체크박스로 각 항목 확인
+            for i, item in enumerate(mode.checklist):
+                checked_items[i] = st.checkbox(item, value=checked_items[i], key=f"meta_{i}")
+                st.session_state.checklist[i] = checked_items[i]
+
+            # 모든 항목 체크 여부 확인
+            if all(checked_items):
+                st.success("✅ 모든 항목을 확인했습니다! 연습을 시작할 준비가 되었습니다.")
+            else:
+                st.warning("⚠️ 모든 항목을 확인한 후 연습을 시작하는 것을 권장합니다.")
+
+            # 추가 안내 메시지
+            st.info("""
+            **💡 상위인지 점검의 중요성:**
+            - 자신의 학습 상태를 스스로 점검하는 능력을 기릅니다
+            - 효과적인 채점을 위한 사전 준비를 도와줍니다
+            - 학습 목표를 명확히 하고 집중력을 높입니다
+            """)
+
+    all_checked = all(checked_items)
+
+    st.markdown("---")
+    st.markdown(mode.guide_heading)
+    st.info(mode.guide_info)
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.button("⬅️ 이전으로", on_click=_on_goto, args=(mode, START))
+
+    with col2:
+        # 상위인지 점검 완료 여부에 따라 버튼 활성화
+        if all_checked:
+            st.button("🚀 연습 시작하기", on_click=_on_goto, args=(mode, PRACTICE))
+        else:
+            st.button("🚀 연습 시작하기", disabled=True,
+                      help="모든 상위인지 점검 항목을 확인해주세요")
+
+
+@traced
+@profiling.profiled
+def practice_screen(mode):
+    st.subheader(mode.practice_title)
+
+    # 문제 목록 초기화
+    if not st.session_state.item_order:
+        names = item_names(mode.folder)
+        if not names:
+            st.error(f"{mode.folder.rsplit('/', 1)[-1]} 폴더 내 파일을 불러올 수 없습니다.")
+            return
+        _reset_practice()
+        st.session_state.item_names = names
+        st.session_state.item_order = array(
+            "I", random.sample(range(len(names)), min(st.session_state.num_questions, len(names)))
+        )
+        st.session_state.item_started = time.time()
+        # 이번 연습의 문항 전체를 한 번에 동시 로드
+        warm_items(mode.folder, [names[i] for i in st.session_state.item_order])
+
+    idx = st.session_state.item_index
+    total = st.session_state.num_questions
+
+    # 모든 문제를 완료했으면 결과 화면으로 (보통은 _on_next에서 이미 넘어간다)
+    if idx >= total:
+        goto(mode, RESULT)
+        result_screen(mode)
+        return
+
+    # 현재 문제 로드
+    name = _item_name(idx)
+    try:
+        item = get_item(mode.folder, name)
+    except Exception as e:
+        st.error(f"파일 파싱 중 오류 발생: {e}")
+        return
+
+    # 다음 문항 미리 읽기 (사용자가 현재 글을 읽는 동안)
+    upcoming = st.session_state.item_order[idx + 1:idx + 1 + PREFETCH_DEPTH]
+    prefetch_items(mode.folder, [st.session_state.item_names[i] for i in upcoming])
+
+    # 진행률 표시
+    progress = (idx) / total
+    st.progress(progress, text=f"진행률: {idx}/{total} ({progress*100:.1f}%)")
+
+    st.markdown(f"### 문항 {idx + 1} / {total}")
+    st.markdown(f"""<div style="
+        background-color: white;
+        color: black;
+        font-size: 18px;
+        white-space: pre-wrap;
+        padding: 15px;
+        border-radius: 8px;
+        box-shadow: 0 0 5px rgba(0,0,0,0.1);
+        ">{item.text}</div>""", unsafe_allow_html=True)
+
+    # 답안 입력, 제출, 채점 결과 (입력을 바꾸거나 제출하면 이 영역만 다시 그린다)
+    answer_panel(mode, idx, item)
+
+
+@st.fragment
+def answer_panel(mode, idx, item):
+    """답안 입력과 채점 결과 영역 (글, 제목, 진행률은 다시 보내지 않는다)"""
+    # 답안 입력 및 제출 전
+    if not st.session_state.submitted:
+        mode.render_input(idx)
+        st.button("제출", key=f"submit_{idx}", on_click=_on_submit, args=(mode, idx))
+        return
+
+    # 답안 제출 후 결과 표시 (결과 기록은 _on_submit에서 한다)
+    mode.render_result(item, st.session_state.response)
+    if not all(mode.check(item, st.session_state.response)):
+        try:
+            show_image(f"{mode.feedback_folder}/{item.qnum}.png")
+        except:
+            st.warning("피드백 이미지를 불러올 수 없습니다.")
+
+    # 글과 진행률이 바뀌므로 앱 전체를 다시 실행한다 (_on_next)
+    st.button("다음 문제로", key=f"next_{idx}", on_click=_on_next, args=(mode,))
+
+
+@traced
+def result_screen(mode):
+    st.title(mode.result_title)
+
+    results = st.session_state.results
+    if results:
+        # 정답/오답 개수 (기록할 때 누적해 둔 값)
+        correct_count = results.correct_count
+        total_count = len(results)
+        accuracy = results.accuracy()
+
+        # 요약 통계
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("총 문항 수", total_count)
+        with col2:
+            st.metric("정답 수", correct_count)
+        with col3:
+            st.metric("정답률", f"{accuracy:.1f}%")
+
+        # 성취도에 따른 메시지
+        for threshold, kind, message in mode.summary_messages:
+            if accuracy >= threshold:
+                getattr(st, kind)(message)
+                break
+
+        # 영역별 정답률과 채점 경향
+        frame = records_frame(results, mode.dimensions)
+        st.markdown("### 📈 영역별 분석")
+        st.dataframe(
+            dimension_summary(frame).rename(columns=SUMMARY_LABELS).rename_axis("영역").round(2)
+        )
+        st.caption("평균 편향이 양수면 정답보다 높게, 음수면 낮게 채점하는 경향입니다.")
+        if mode.key == "grade":
+            st.markdown("#### 등급 혼동 행렬 (행: 정답 등급, 열: 선택한 등급)")
+            st.dataframe(grade_confusion(frame))
+
+        st.markdown("### 📝 상세 결과")
+        for r in results:
+            if r.correct:
+                st.markdown(f"✅ {r.qnum}번 문항: 정답")
+            else:
+                st.markdown(f"❌ {r.qnum}번 문항: 오답")
+    else:
+        st.info("결과가 없습니다.")
+
+    st.markdown("---")
+    columns = st.columns(3 if mode.guide else 2)
+
+    if mode.guide:
+        with columns[0]:
+            st.button("📋 과제 다시보기", on_click=_on_goto, args=(mode, GUIDE))
+
+    with columns[-2]:
+        st.button("🔄 다시 연습하기", on_click=_on_restart, args=(mode,))
+
+    with columns[-1]:
+        st.button("🏠 프로그램 종료", on_click=_on_exit, args=(mode,))
+
+
+@traced
+def run(mode):
+    """앱 진입점: 세션 상태를 준비하고 현재 단계의 화면을 그린다"""
+    st.set_page_config(page_title=mode.page_title, layout="wide")
+
+    # 추적이 켜져 있을 때만 동작 (/metrics 서버, ?diagnostics 진단 화면)
+    tracing.ensure_metrics_server()
+    if diagnostics.requested():
+        diagnostics.run()
+        return
+    # SEP_ME_PROFILE_DIR가 설정돼 있을 때 ?profile=K로 이 세션의 다음 K번 연습 화면 실행을 프로파일링
+    profiling.arm_from_query()
+
+    # 세션 상태 초기화
+    initialize_session_state()
+
+    # 로컬 문항 미리 읽기 (프로세스당 1회)
+    preload_items(mode.folder)
+
+    # 단계별 화면 매핑
+    screens = {
+        START: start_screen,
+        GUIDE: guide_screen,
+        PRACTICE: practice_screen,
+        RESULT: result_screen,
+    }
+    steps = _step_names(mode)
+
+    # 유효하지 않은 단계값 처리
+    if st.session_state.step not in range(len(steps)):
+        st.warning("잘못된 단계 값입니다. 초기화합니다.")
+        reset_state()
+        st.rerun()
+
+    # 현재 단계의 화면 실행
+    with span("dispatch"):
+        screens[steps[st.session_state.step]](mode)
+
+    if tracing.ENABLED:
+        # 세션 상태 크기 (모든 세션이 공유하는 문항 이름 튜플은 제외)
+        ctx = get_script_run_ctx()
+        if ctx is not None:
+            session_size.record(ctx.session_id, session_size.state_bytes(
+                st.session_state, shared=(st.session_state.item_names,)
+            ))
@@ -0,0 +1,105 @@
+"""세션 하나만 프로파일링: 주소에 ?profile=K&profile_key=<키>를 붙이면 그 세션의 다음 K번 연습 화면 실행을 cProfile로 기록한다
+
+SEP_ME_PROFILE_DIR와 SEP_ME_PROFILE_KEY를 둘 다 설정했을 때만 동작하고, 실행마다 pstats 파일을 그 폴더에 남긴다.
+폴더의 pstats 파일이 MAX_FILES개가 되면 더 남기지 않는다.
+다른 사용자나 서버 재시작 없이 느린 교실 세션 하나를 진단할 때 쓴다.
+
+    python -m pstats data/profiles/<파일>.pstats     # 또는 snakeviz 등으로 열기
+"""
+import cProfile
+import functools
+import hmac
+import logging
+import os
+import threading
+import time
+import uuid
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# pstats 파일을 남길 폴더 (빈 문자열이면 프로파일링 요청을 무시)
+PROFILE_DIR = os.environ.get("SEP_ME_PROFILE_DIR", "")
+# ?profile_key= 값이 이 키와 같아야 프로파일링을 켠다 (빈 문자열이면 프로파일링 요청을 무시)
+KEY = os.environ.get("SEP_ME_PROFILE_KEY", "")
+QUERY_PARAM = "profile"
+KEY_PARAM = "profile_key"
+# 요청 한 번에 기록할 수 있는 최대 실행 수
+MAX_RUNS = 50
+# 폴더에 남길 수 있는 최대 pstats 파일 수 (다 차면 지우기 전까지 더 남기지 않는다)
+MAX_FILES = int(os.environ.get("SEP_ME_PROFILE_MAX_FILES", "500"))
+
+_LOCK = threading.Lock()
+
+
+def arm_from_query():
+    """주소의 ?profile=K(와 맞는 키)를 읽어 이 세션의 남은 프로파일링 횟수로 (새로 고침해도 다시 켜지지 않게 주소에서 지운다)"""
+    if not PROFILE_DIR or QUERY_PARAM not in st.query_params:
+        return
+    value = st.query_params[QUERY_PARAM]
+    key = st.query_params.get(KEY_PARAM, "")
+    del st.query_params[QUERY_PARAM]
+    if KEY_PARAM in st.query_params:
+        del st.query_params[KEY_PARAM]
+    if not KEY or not hmac.compare_digest(key, KEY):
+        return
+    try:
+        runs = min(max(int(value), 0), MAX_RUNS)
+    except ValueError:
+        return
+    st.session_state.profile_remaining = runs
+    st.session_state.profile_run = 0
+    if "profile_id" not in st.session_state:
+        st.session_state.profile_id = uuid.uuid4().hex[:8]
+    logger.info("세션 %s: 다음 %d번 실행 프로파일링", st.session_state.profile_id, runs)
+
+
+def _dump(profiler, name):
+    """pstats 파일을 남기고 경로를 돌려준다 (폴더가 MAX_FILES개로 차 있으면 None)"""
+    st.session_state.profile_run += 1
+    path = os.path.join(
+        PROFILE_DIR,
+        f"{time.strftime('%Y%m%d-%H%M%S')}-{st.session_state.profile_id}-{name}"
+        f"-{st.session_state.profile_run:02d}.pstats",
+    )
+    with _LOCK:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        if sum(entry.endswith(".pstats") for entry in os.listdir(PROFILE_DIR)) >= MAX_FILES:
+            return None
+        profiler.dump_stats(path)
+    return path
+
+
+def profiled(func):
+    """세션에 남은 프로파일링 횟수가 있으면 이번 실행을 cProfile로 감싸 파일로 남기는 데코레이터"""
+    if not PROFILE_DIR:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if st.session_state.get("profile_remaining", 0) <= 0:
+            return func(*args, **kwargs)
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # 다른 세션이 같은 순간에 프로파일링 중이면 (Python 3.12+) 이번 실행은 건너뛴다
+            logger.warning("프로파일링을 시작할 수 없습니다: %s", e)
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            st.session_state.profile_remaining -= 1
+            try:
+                path = _dump(profiler, func.__name__)
+            except OSError as e:
+                logger.warning("프로파일 저장 실패: %s", e)
+            else:
+                if path is None:
+                    logger.warning("프로파일 폴더가 가득 찼습니다 (%d개): %s", MAX_FILES, PROFILE_DIR)
+                    st.session_state.profile_remaining = 0
+                else:
+                    logger.info("프로파일 저장: %s", path)
+    return wrapper
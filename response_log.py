@@ -0,0 +1,291 @@
+"""채점 응답 기록: 제출한 답안을 로컬 SQLite 파일(WAL)에 덧붙여 저장한다
+
+제출 콜백은 기록을 대기열에 넣기만 하고, 백그라운드 스레드 하나가 쌓인 기록을
+트랜잭션 하나로 묶어 쓴다. 세션이 끝나거나 프로그램을 종료해도 응답이 남는다.
+
+같은 트랜잭션에서 문항별·영역별·연습생별 누적 합계 표도 갱신하므로
+교사용 화면(instructor.py)은 원본 기록을 다시 읽지 않고 합계 표만 읽는다.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+# 기록 파일 경로 (빈 문자열이면 기록하지 않음)
+LOG_PATH = os.environ.get("SEP_ME_RESPONSE_LOG", os.path.join(REPO_DIR, "data", "responses.sqlite3"))
+# 트랜잭션 하나에 쓰는 최대 기록 수
+BATCH_SIZE = int(os.environ.get("SEP_ME_RESPONSE_LOG_BATCH", "500"))
+# 쓰기 실패 후 다시 시도하기까지 기다리는 시간(초)
+RETRY_INTERVAL = 1.0
+# 같은 묶음을 이 횟수만큼 연달아 쓰지 못하면 그 묶음을 버린다
+MAX_ATTEMPTS = 5
+# 아직 쓰지 못한 기록이 이만큼 쌓여 있으면 새 기록은 대기열에 넣지 않고 버린다
+MAX_PENDING = int(os.environ.get("SEP_ME_RESPONSE_LOG_MAX_PENDING", "10000"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    id INTEGER PRIMARY KEY,
+    submitted_at REAL NOT NULL,
+    user_name TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    qnum TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    response TEXT NOT NULL,
+    hits TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    latency REAL
+);
+CREATE TABLE IF NOT EXISTS item_totals (
+    mode TEXT NOT NULL,
+    qnum TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    latency_sum REAL NOT NULL,
+    PRIMARY KEY (mode, qnum)
+);
+CREATE TABLE IF NOT EXISTS dimension_totals (
+    mode TEXT NOT NULL,
+    qnum TEXT NOT NULL,
+    dimension INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    hits INTEGER NOT NULL,
+    error_sum INTEGER NOT NULL,
+    abs_error_sum INTEGER NOT NULL,
+    PRIMARY KEY (mode, qnum, dimension)
+);
+CREATE TABLE IF NOT EXISTS trainee_totals (
+    mode TEXT NOT NULL,
+    user_name TEXT NOT NULL,
+    day TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    PRIMARY KEY (mode, user_name, day)
+);
+CREATE TABLE IF NOT EXISTS confusion_totals (
+    mode TEXT NOT NULL,
+    answer INTEGER NOT NULL,
+    response INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (mode, answer, response)
+);
+"""
+# 합계 표 형식 버전 (PRAGMA user_version). 올라가면 원본 기록에서 합계를 다시 만든다
+AGGREGATE_VERSION = 1
+_INSERT = (
+    "INSERT INTO responses (submitted_at, user_name, mode, qnum, answer, response, hits, correct, latency)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+# 합계 표 갱신 (키가 있으면 더하고 없으면 새로 넣는다)
+_UPSERT_ITEM = (
+    "INSERT INTO item_totals VALUES (?, ?, ?, ?, ?) ON CONFLICT (mode, qnum) DO UPDATE SET"
+    " count = count + excluded.count, correct = correct + excluded.correct,"
+    " latency_sum = latency_sum + excluded.latency_sum"
+)
+_UPSERT_DIMENSION = (
+    "INSERT INTO dimension_totals VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (mode, qnum, dimension)"
+    " DO UPDATE SET count = count + excluded.count, hits = hits + excluded.hits,"
+    " error_sum = error_sum + excluded.error_sum, abs_error_sum = abs_error_sum + excluded.abs_error_sum"
+)
+_UPSERT_TRAINEE = (
+    "INSERT INTO trainee_totals VALUES (?, ?, ?, ?, ?) ON CONFLICT (mode, user_name, day) DO UPDATE SET"
+    " count = count + excluded.count, correct = correct + excluded.correct"
+)
+_UPSERT_CONFUSION = (
+    "INSERT INTO confusion_totals VALUES (?, ?, ?, ?) ON CONFLICT (mode, answer, response) DO UPDATE SET"
+    " count = count + excluded.count"
+)
+
+_queue = queue.SimpleQueue()
+_writer = None
+_LOCK = threading.Lock()
+_STATS = {"queued": 0, "written": 0, "batches": 0, "errors": 0, "dropped": 0, "rejected": 0}
+
+
+def connect(path=LOG_PATH):
+    """기록 파일 연결 (WAL 모드, 표가 없으면 만들고 합계 표가 오래됐으면 다시 만든다)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != AGGREGATE_VERSION:
+        rebuild_aggregates(conn)
+    return conn
+
+
+def _day(timestamp):
+    return time.strftime("%Y-%m-%d", time.localtime(timestamp))
+
+
+def _aggregate(rows):
+    """기록 묶음만큼의 합계 표 증분 (갱신 SQL -> 매개변수 목록)"""
+    items, dimensions, trainees, confusion = {}, {}, {}, {}
+    for submitted_at, user_name, mode, qnum, answer, response, hits, correct, latency in rows:
+        total = items.setdefault((mode, qnum), [0, 0, 0.0])
+        total[0] += 1
+        total[1] += correct
+        total[2] += latency or 0.0
+        for i, (expected, given, hit) in enumerate(zip(answer, response, hits)):
+            total = dimensions.setdefault((mode, qnum, i), [0, 0, 0, 0])
+            total[0] += 1
+            total[1] += hit
+            total[2] += given - expected
+            total[3] += abs(given - expected)
+        total = trainees.setdefault((mode, user_name, _day(submitted_at)), [0, 0])
+        total[0] += 1
+        total[1] += correct
+        # 등급처럼 영역이 하나인 모드만 혼동 행렬을 만든다
+        if len(answer) == 1:
+            key = (mode, answer[0], response[0])
+            confusion[key] = confusion.get(key, 0) + 1
+    return {
+        _UPSERT_ITEM: [key + tuple(total) for key, total in items.items()],
+        _UPSERT_DIMENSION: [key + tuple(total) for key, total in dimensions.items()],
+        _UPSERT_TRAINEE: [key + tuple(total) for key, total in trainees.items()],
+        _UPSERT_CONFUSION: [key + (count,) for key, count in confusion.items()],
+    }
+
+
+def _encode(row):
+    submitted_at, user_name, mode, qnum, answer, response, hits, correct, latency = row
+    return (
+        submitted_at, user_name, mode, qnum,
+        json.dumps(answer), json.dumps(response), json.dumps([int(hit) for hit in hits]),
+        correct, latency,
+    )
+
+
+def _write(conn, rows):
+    with conn:
+        conn.executemany(_INSERT, [_encode(row) for row in rows])
+        for sql, params in _aggregate(rows).items():
+            conn.executemany(sql, params)
+
+
+def rebuild_aggregates(conn):
+    """원본 기록 전체에서 합계 표를 다시 만든다 (합계 표 형식이 바뀌었을 때)"""
+    with conn:
+        for table in ("item_totals", "dimension_totals", "trainee_totals", "confusion_totals"):
+            conn.execute(f"DELETE FROM {table}")
+        cursor = conn.execute(
+            "SELECT submitted_at, user_name, mode, qnum, answer, response, hits, correct, latency"
+            " FROM responses"
+        )
+        while True:
+            batch = cursor.fetchmany(10000)
+            if not batch:
+                break
+            rows = [
+                (ts, user, mode, qnum, json.loads(a), json.loads(r), json.loads(h), correct, latency)
+                for ts, user, mode, qnum, a, r, h, correct, latency in batch
+            ]
+            for sql, params in _aggregate(rows).items():
+                conn.executemany(sql, params)
+        conn.execute(f"PRAGMA user_version = {AGGREGATE_VERSION}")
+
+
+def _run():
+    conn = None
+    pending = []
+    while True:
+        entry = _queue.get()
+        waiters = []
+        # 대기열에 쌓인 만큼 한 번에 꺼낸다 (BATCH_SIZE까지)
+        while entry is not None:
+            if isinstance(entry, threading.Event):
+                waiters.append(entry)
+            else:
+                pending.append(entry)
+                if len(pending) >= BATCH_SIZE:
+                    break
+            try:
+                entry = _queue.get_nowait()
+            except queue.Empty:
+                entry = None
+        attempts = 0
+        while pending:
+            try:
+                if conn is None:
+                    conn = connect()
+                _write(conn, pending)
+            except Exception as e:
+                # sqlite3.Error뿐 아니라 폴더를 만들 수 없는 경우(OSError) 등도 여기서 처리해 스레드가 죽지 않게 한다
+                attempts += 1
+                with _LOCK:
+                    _STATS["errors"] += 1
+                if conn is not None:
+                    conn.close()
+                    conn = None
+                if attempts >= MAX_ATTEMPTS:
+                    logger.error("응답 기록 실패 (%d건, %d번 시도 후 버림): %s", len(pending), attempts, e)
+                    with _LOCK:
+                        _STATS["dropped"] += len(pending)
+                    pending = []
+                    continue
+                logger.warning("응답 기록 실패 (%d건, 다시 시도): %s", len(pending), e)
+                time.sleep(RETRY_INTERVAL)
+                continue
+            with _LOCK:
+                _STATS["written"] += len(pending)
+                _STATS["batches"] += 1
+            pending = []
+        for waiter in waiters:
+            waiter.set()
+
+
+def _ensure_writer():
+    global _writer
+    if _writer is None:
+        with _LOCK:
+            if _writer is None:
+                _writer = threading.Thread(target=_run, name="response-log", daemon=True)
+                _writer.start()
+                atexit.register(flush, 5.0)
+
+
+def log_response(user_name, mode, record):
+    """채점 결과(ResultRecord) 한 건을 기록 대기열에 넣는다 (디스크 쓰기는 백그라운드 스레드에서)"""
+    if not LOG_PATH:
+        return
+    _ensure_writer()
+    with _LOCK:
+        if _STATS["queued"] - _STATS["written"] - _STATS["dropped"] >= MAX_PENDING:
+            # 쓰기가 계속 실패해 밀려 있으면 메모리가 끝없이 늘지 않도록 버린다
+            _STATS["rejected"] += 1
+            return
+        _STATS["queued"] += 1
+    _queue.put((
+        record.submitted_at,
+        user_name,
+        mode,
+        record.qnum,
+        record.answer,
+        record.response,
+        record.hits,
+        int(record.correct),
+        record.elapsed if record.started_at is not None else None,
+    ))
+
+
+def flush(timeout=None):
+    """지금까지 넣은 기록이 파일에 쓰일 때까지 기다린다 (시간 안에 끝나면 True)"""
+    if _writer is None:
+        return True
+    done = threading.Event()
+    _queue.put(done)
+    return done.wait(timeout)
+
+
+def log_stats():
+    """기록 통계 (대기열에 넣은 수, 쓴 수, 트랜잭션 수, 실패 수, 쓰지 못해 버린 수, 밀려서 받지 않은 수, 남은 수)"""
+    with _LOCK:
+        stats = dict(_STATS)
+    stats["pending"] = stats["queued"] - stats["written"] - stats["dropped"]
+    return stats
@@ -0,0 +1,66 @@
+"""세션별 채점 결과 기록: 문항별 결과 레코드와 정답 수"""
+
+
+class ResultRecord:
+    """문항 하나의 채점 결과
+
+    answer, response, hits는 채점 영역 순서의 튜플이다
+    (등급 추정은 (등급,), 점수 추정은 (내용, 조직, 표현)).
+    """
+
+    __slots__ = ("qnum", "answer", "response", "hits", "started_at", "submitted_at")
+
+    def __init__(self, qnum, answer, response, hits, started_at, submitted_at):
+        self.qnum = qnum
+        self.answer = answer
+        self.response = response
+        self.hits = hits
+        self.started_at = started_at
+        self.submitted_at = submitted_at
+
+    @property
+    def correct(self):
+        """모든 영역이 정답이면 True"""
+        return all(self.hits)
+
+    @property
+    def elapsed(self):
+        """문항을 보여 준 뒤 제출까지 걸린 시간(초)"""
+        return self.submitted_at - self.started_at
+
+    def __repr__(self):
+        return f"ResultRecord(qnum={self.qnum!r}, answer={self.answer}, response={self.response})"
+
+
+class ResultStore:
+    """채점 결과 목록과 정답 수 (문항 번호당 한 번만 기록, 영역별 분석은 analytics.py)"""
+
+    __slots__ = ("records", "correct_count", "_qnums")
+
+    def __init__(self):
+        self.records = []
+        self.correct_count = 0
+        self._qnums = set()
+
+    def add(self, record):
+        """결과 추가 (이미 기록한 문항이면 무시하고 False)"""
+        if record.qnum in self._qnums:
+            return False
+        self._qnums.add(record.qnum)
+        self.records.append(record)
+        if record.correct:
+            self.correct_count += 1
+        return True
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __contains__(self, qnum):
+        return qnum in self._qnums
+
+    def accuracy(self):
+        """정답률(%)"""
+        return self.correct_count / len(self.records) * 100 if self.records else 0.0
@@ -0,0 +1,119 @@
+"""연습2: 글의 영역별 점수 추정 모드"""
+import streamlit as st
+
+from practice_engine import PracticeMode
+
+# 정답으로 인정하는 점수 차이 (±1점)
+TOLERANCE = 1
+
+
+def render_input(idx):
+    """영역별 점수 입력 위젯 (내용, 조직, 표현 점수 튜플을 돌려준다)"""
+    st.markdown("#### 각 영역별 점수를 입력하세요:")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        uc = st.number_input("내용 점수", min_value=3, max_value=18, value=10, key=f"uc_{idx}")
+    with col2:
+        uo = st.number_input("조직 점수", min_value=2, max_value=12, value=7, key=f"uo_{idx}")
+    with col3:
+        ue = st.number_input("표현 점수", min_value=2, max_value=12, value=7, key=f"ue_{idx}")
+
+    return uc, uo, ue
+
+
+def read_input(idx):
+    """세션 상태에 남아 있는 영역별 점수 (제출 콜백용)"""
+    state = st.session_state
+    return state.get(f"uc_{idx}", 10), state.get(f"uo_{idx}", 7), state.get(f"ue_{idx}", 7)
+
+
+def expected(item):
+    """정답 점수 (내용, 조직, 표현)"""
+    return item.content, item.organization, item.expression
+
+
+def check(item, scores):
+    """영역별 정답 여부 (±1점 허용)"""
+    return tuple(abs(user - answer) <= TOLERANCE for user, answer in zip(scores, expected(item)))
+
+
+def render_result(item, scores):
+    """영역별 채점 결과 표시"""
+    uc, uo, ue = scores
+    c, o, e = expected(item)
+    is_c, is_o, is_e = check(item, scores)
+
+    st.markdown("#### 📊 채점 결과")
+
+    # 결과를 표로 표시
+    col1, col2, col3, col4 = st.columns(4)
+
+    for col, label, user_score, answer, ok in (
+        (col1, "내용", uc, c, is_c),
+        (col2, "조직", uo, o, is_o),
+        (col3, "표현", ue, e, is_e),
+    ):
+        with col:
+            st.metric("영역", label)
+            st.metric("내 점수", user_score)
+            st.metric("정답", answer)
+            if ok:
+                st.success("✅ 정답")
+            else:
+                st.error("❌ 오답")
+
+    with col4:
+        st.metric("총점 (내)", uc + uo + ue)
+        st.metric("총점 (정답)", c + o + e)
+        if is_c and is_o and is_e:
+            st.success("🎉 완벽!")
+        else:
+            st.warning("📚 학습 필요")
+
+    # 전체 결과 판정
+    if is_c and is_o and is_e:
+        st.success("🎉 모든 요소 정답입니다!")
+    else:
+        st.error("📚 오답 항목이 있습니다. 아래 피드백을 참고하세요.")
+
+
+SCORE_MODE = PracticeMode(
+    key="score",
+    folder="data/scre",
+    feedback_folder="data/f_score",
+    page_title="SEP ME 6 - 점수 추정 모드",
+    title="📘 학생 글 채점 연습 프로그램 SEP ME 6 (점수 추정 모드)",
+    practice_title="✏️ [연습2] 글의 점수 추정하기",
+    result_title="📊 점수 추정 연습 결과 요약",
+    guide=True,
+    # 점수 추정용 상위인지 점검 체크리스트
+    checklist=[
+        "쓰기 과제의 내용과 요구사항을 충분히 이해했다",
+        "내용, 조직, 표현 영역의 평가 기준을 숙지했다",
+        "각 영역별 점수 범위(내용 3-18점, 조직/표현 2-12점)를 기억하고 있다",
+        "점수 추정 시 ±1점 허용 범위를 이해했다",
+        "학생 글을 객관적으로 평가할 준비가 되었다"
+    ],
+    guide_heading="### 🎯 점수 추정 연습 안내",
+    guide_info="""
+    **점수 추정 연습에서는:**
+    - 학생이 작성한 글을 읽고 각 영역별 점수를 추정합니다
+    - **내용** (3~18점), **조직** (2~12점), **표현** (2~12점)
+    - 정답과 ±1점 이내면 정답으로 인정됩니다
+    - 틀린 문항에 대해서는 상세한 피드백을 제공합니다
+    """,
+    dimensions=("내용", "조직", "표현"),
+    expected=expected,
+    check=check,
+    render_input=render_input,
+    read_input=read_input,
+    input_keys=("uc", "uo", "ue"),
+    render_result=render_result,
+    summary_messages=[
+        (80, "success", "🎉 우수한 성과입니다! 점수 추정 능력이 뛰어납니다."),
+        (60, "info", "👍 양호한 성과입니다. 조금 더 연습하면 더 좋아질 것입니다."),
+        (0, "warning", "📚 더 많은 연습이 필요합니다. 평가 기준을 다시 확인해보세요."),
+    ],
+)
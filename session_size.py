@@ -0,0 +1,71 @@
+"""세션 상태 크기: 세션마다 st.session_state가 차지하는 바이트를 재고 최근 세션들의 분포를 보관한다
+
+모든 세션이 함께 쓰는 객체(문항 이름 튜플 등)는 한 번만 존재하므로 세션 크기에서 뺀다.
+추적(SEP_ME_TRACING)이 켜져 있을 때만 practice_engine.run이 실행마다 기록한다.
+"""
+import sys
+import threading
+import time
+from array import array
+
+# 이 시간(초) 동안 실행이 없던 세션은 분포에서 뺀다
+SESSION_TTL = 3600
+
+_LOCK = threading.Lock()
+# 세션 id -> (마지막 실행 시각, 바이트)
+_SIZES = {}
+
+
+def deep_size(obj, skip=frozenset()):
+    """obj와 obj가 가리키는 컨테이너/슬롯 객체의 sys.getsizeof 합계 (skip에 든 id는 제외)"""
+    seen = set(skip)
+    total = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, int, float, bool, array)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            for cls in type(obj).__mro__:
+                for name in getattr(cls, "__slots__", ()):
+                    if hasattr(obj, name):
+                        stack.append(getattr(obj, name))
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+    return total
+
+
+def state_bytes(state, shared=()):
+    """세션 상태(키 -> 값 매핑)의 바이트 (shared로 넘긴 공유 객체는 제외)"""
+    skip = frozenset(id(obj) for obj in shared)
+    return sum(deep_size(key, skip) + deep_size(state[key], skip) for key in list(state.keys()))
+
+
+def record(session_id, nbytes):
+    now = time.monotonic()
+    with _LOCK:
+        _SIZES[session_id] = (now, nbytes)
+        for key in [k for k, (seen, _) in _SIZES.items() if now - seen > SESSION_TTL]:
+            del _SIZES[key]
+
+
+def size_summary():
+    """최근 SESSION_TTL초 안에 실행된 세션 수와 세션 크기 합계/평균/최대(바이트)"""
+    now = time.monotonic()
+    with _LOCK:
+        sizes = [nbytes for seen, nbytes in _SIZES.values() if now - seen <= SESSION_TTL]
+    return {
+        "sessions": len(sizes),
+        "total": sum(sizes),
+        "mean": sum(sizes) / len(sizes) if sizes else 0,
+        "max": max(sizes, default=0),
+    }
@@ -0,0 +1,95 @@
+"""analytics: 영역별 정답률/평균 편향/평균 절대 오차와 등급 혼동 행렬을 손으로 센 값과 비교한다
+
+    python -m pytest tests/
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import dimension_summary, grade_confusion, records_frame  # noqa: E402
+from results import ResultRecord  # noqa: E402
+
+SCORE_DIMENSIONS = ("내용", "조직", "표현")
+
+
+def record(qnum, answer, response):
+    hits = tuple(a == r for a, r in zip(answer, response))
+    return ResultRecord(qnum, answer, response, hits, 0.0, 1.0)
+
+
+@pytest.fixture
+def score_records():
+    return [
+        record("1", (10, 7, 8), (10, 8, 8)),
+        record("2", (12, 6, 7), (9, 6, 9)),
+        record("3", (8, 9, 5), (8, 7, 5)),
+        record("4", (11, 5, 6), (13, 5, 5)),
+    ]
+
+
+def test_records_frame_is_long_format(score_records):
+    frame = records_frame(score_records, SCORE_DIMENSIONS, user="kim")
+    assert len(frame) == 4 * 3
+    assert list(frame["dimension"][:3]) == list(SCORE_DIMENSIONS)
+    assert list(frame["qnum"][:4]) == ["1", "1", "1", "2"]
+    assert (frame["user"] == "kim").all()
+
+
+def test_dimension_summary_matches_hand_counts(score_records):
+    summary = dimension_summary(records_frame(score_records, SCORE_DIMENSIONS))
+    assert list(summary.index) == list(SCORE_DIMENSIONS)
+    assert list(summary["count"]) == [4, 4, 4]
+    # 내용: 응답 - 정답 = 0, -3, 0, +2
+    assert summary.loc["내용", "hit_rate"] == pytest.approx(50.0)
+    assert summary.loc["내용", "bias"] == pytest.approx(-0.25)
+    assert summary.loc["내용", "mae"] == pytest.approx(1.25)
+    # 조직: +1, 0, -2, 0
+    assert summary.loc["조직", "hit_rate"] == pytest.approx(50.0)
+    assert summary.loc["조직", "bias"] == pytest.approx(-0.25)
+    assert summary.loc["조직", "mae"] == pytest.approx(0.75)
+    # 표현: 0, +2, 0, -1
+    assert summary.loc["표현", "hit_rate"] == pytest.approx(50.0)
+    assert summary.loc["표현", "bias"] == pytest.approx(0.25)
+    assert summary.loc["표현", "mae"] == pytest.approx(0.75)
+
+
+def test_dimension_summary_by_user(score_records):
+    import pandas as pd
+
+    frame = pd.concat([
+        records_frame(score_records[:2], SCORE_DIMENSIONS, user="kim"),
+        records_frame(score_records[2:], SCORE_DIMENSIONS, user="lee"),
+    ], ignore_index=True)
+    summary = dimension_summary(frame, by=("user", "dimension"))
+    assert len(summary) == 2 * 3
+    # kim의 내용: 0, -3 / lee의 내용: 0, +2
+    assert summary.loc[("kim", "내용"), "bias"] == pytest.approx(-1.5)
+    assert summary.loc[("lee", "내용"), "bias"] == pytest.approx(1.0)
+    assert summary.loc[("lee", "조직"), "hit_rate"] == pytest.approx(50.0)
+
+
+def test_grade_confusion_counts_pairs():
+    records = [
+        record("1", (3,), (3,)),
+        record("2", (3,), (4,)),
+        record("3", (3,), (4,)),
+        record("4", (1,), (2,)),
+        record("5", (5,), (5,)),
+    ]
+    confusion = grade_confusion(records_frame(records, ("등급",)))
+    assert confusion.shape == (5, 5)
+    assert confusion.loc[3, 3] == 1
+    assert confusion.loc[3, 4] == 2
+    assert confusion.loc[1, 2] == 1
+    assert confusion.loc[5, 5] == 1
+    assert confusion.to_numpy().sum() == len(records)
+
+
+def test_grade_confusion_skips_values_outside_labels():
+    records = [record("1", (3,), (3,)), record("2", (3,), (9,)), record("3", (0,), (2,))]
+    confusion = grade_confusion(records_frame(records, ("등급",)))
+    assert confusion.to_numpy().sum() == 1
+    assert confusion.loc[3, 3] == 1
@@ -0,0 +1,179 @@
+"""http_client: 로컬 HTTP 서버를 원격 저장소 대신 세워 시간 제한, 재시도, 지연 시간 히스토그램을 확인한다
+
+    python -m pytest tests/
+"""
+import http.server
+import os
+import sys
+import threading
+import time
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import http_client  # noqa: E402
+
+
+class StandInServer(http.server.BaseHTTPRequestHandler):
+    """미리 정한 응답을 차례로 내려주는 가짜 원격 저장소 (다 쓰면 마지막 응답을 반복)"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    # [(상태 코드, 추가 헤더, 응답 전에 기다리는 시간(초)), ...]
+    script = [(200, (), 0.0)]
+    hits = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with self.lock:
+            i = type(self).hits
+            type(self).hits += 1
+        status, headers, delay = self.script[min(i, len(self.script) - 1)]
+        if delay:
+            time.sleep(delay)
+        body = b"ok"
+        try:
+            self.send_response(status)
+            for name, value in headers:
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # 시간 제한으로 클라이언트가 먼저 끊은 경우
+            pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandInServer)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, name="stand-in", daemon=True).start()
+    yield f"127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def serve(server, monkeypatch):
+    """응답 순서를 정하고, 새 설정으로 공용 세션과 히스토그램을 다시 만든다"""
+    monkeypatch.setattr(http_client, "BACKOFF_FACTOR", 0.0)
+    monkeypatch.setattr(http_client, "BACKOFF_JITTER", 0.0)
+    monkeypatch.setattr(http_client, "_session", None)
+    monkeypatch.setattr(http_client, "_HISTOGRAMS", {})
+    monkeypatch.setattr(http_client, "_SLOTS", {})
+
+    def serve(*script):
+        StandInServer.script = list(script)
+        StandInServer.hits = 0
+        return f"http://{server}/data/grade/1.txt"
+    return serve
+
+
+def test_success_is_recorded_in_host_histogram(serve, server):
+    url = serve((200, (), 0.0))
+    for _ in range(3):
+        assert http_client.get(url).status_code == 200
+    hist = http_client.latency_histograms()[server]
+    assert hist["count"] == 3
+    assert hist["errors"] == 0
+    assert sum(hist["buckets"]) == 3
+    assert len(hist["buckets"]) == len(http_client.LATENCY_BUCKETS) + 1
+    assert 0 < hist["sum"] < 3 * http_client.READ_TIMEOUT
+
+
+def test_server_errors_are_retried(serve, server):
+    url = serve((503, (), 0.0), (502, (), 0.0), (200, (), 0.0))
+    response = http_client.get(url)
+    assert response.status_code == 200
+    assert StandInServer.hits == 3
+    hist = http_client.latency_histograms()[server]
+    # 재시도는 호출 한 번으로 기록된다
+    assert (hist["count"], hist["errors"]) == (1, 0)
+
+
+def test_retries_are_bounded(serve, server, monkeypatch):
+    monkeypatch.setattr(http_client, "MAX_RETRIES", 2)
+    url = serve((500, (), 0.0))
+    response = http_client.get(url)
+    assert response.status_code == 500
+    assert StandInServer.hits == 3
+    hist = http_client.latency_histograms()[server]
+    assert (hist["count"], hist["errors"]) == (1, 1)
+
+
+def test_retry_after_is_capped(serve, monkeypatch):
+    monkeypatch.setattr(http_client, "RETRY_AFTER_MAX", 1)
+    url = serve((429, (("Retry-After", "3600"),), 0.0), (200, (), 0.0))
+    start = time.perf_counter()
+    response = http_client.get(url)
+    elapsed = time.perf_counter() - start
+    assert response.status_code == 200
+    assert StandInServer.hits == 2
+    assert 0.9 <= elapsed < 3
+
+
+def test_read_timeout(serve, server, monkeypatch):
+    monkeypatch.setattr(http_client, "READ_TIMEOUT", 0.2)
+    monkeypatch.setattr(http_client, "MAX_RETRIES", 3)
+    url = serve((200, (), 1.0))
+    start = time.perf_counter()
+    with pytest.raises(requests.exceptions.ConnectionError):
+        http_client.get(url)
+    elapsed = time.perf_counter() - start
+    # 응답 대기 시간 초과는 READ_RETRIES(1)번만 다시 시도하고, 각각 READ_TIMEOUT에서 끊긴다
+    assert StandInServer.hits == 2
+    assert elapsed < 1.0
+    hist = http_client.latency_histograms()[server]
+    assert (hist["count"], hist["errors"]) == (1, 1)
+
+
+def test_explicit_timeout_overrides_default(serve, monkeypatch):
+    monkeypatch.setattr(http_client, "MAX_RETRIES", 0)
+    url = serve((200, (), 0.5))
+    with pytest.raises(requests.exceptions.ConnectionError):
+        http_client.get(url, timeout=0.1)
+    assert http_client.get(url, timeout=2).status_code == 200
+
+
+def test_deadline_stops_retries(serve, monkeypatch):
+    monkeypatch.setattr(http_client, "READ_TIMEOUT", 0.2)
+    monkeypatch.setattr(http_client, "READ_RETRIES", 3)
+    monkeypatch.setattr(http_client, "DEADLINE", 0.3)
+    url = serve((200, (), 1.0))
+    with pytest.raises(requests.exceptions.ConnectionError):
+        http_client.get(url)
+    # 두 번째 시도가 끝났을 때 마감이 지났으므로 세 번째는 시작하지 않는다
+    assert StandInServer.hits == 2
+
+
+def test_deadline_returns_last_response_instead_of_waiting(serve, monkeypatch):
+    monkeypatch.setattr(http_client, "DEADLINE", 0.5)
+    url = serve((503, (("Retry-After", "2"),), 0.0), (200, (), 0.0))
+    start = time.perf_counter()
+    response = http_client.get(url)
+    assert response.status_code == 503
+    assert StandInServer.hits == 1
+    assert time.perf_counter() - start < 0.5
+
+
+def test_pool_wait_is_bounded(serve, server, monkeypatch):
+    monkeypatch.setattr(http_client, "POOL_MAXSIZE", 1)
+    monkeypatch.setattr(http_client, "POOL_TIMEOUT", 0.2)
+    url = serve((200, (), 1.0))
+    slow = threading.Thread(target=http_client.get, args=(url,))
+    slow.start()
+    while StandInServer.hits == 0:
+        time.sleep(0.01)
+    start = time.perf_counter()
+    with pytest.raises(requests.exceptions.ConnectionError):
+        http_client.get(url)
+    assert time.perf_counter() - start < 0.5
+    slow.join()
+    hist = http_client.latency_histograms()[server]
+    assert (hist["count"], hist["errors"]) == (2, 1)
@@ -0,0 +1,151 @@
+"""item_bank: 로컬 HTTP 서버를 GitHub 폴더 목록 API 대신 세워 목록 캐시의 TTL, ETag 재검증, 장애 시 이전 목록 사용을 확인한다
+
+    python -m pytest tests/
+"""
+import http.server
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import http_client  # noqa: E402
+import item_bank  # noqa: E402
+
+KEY = ("liisso", "sep-me-streamlit1", "main", "data/grade")
+
+
+class StandInGitHub(http.server.BaseHTTPRequestHandler):
+    """ETag를 붙여 폴더 목록을 내려주고 If-None-Match가 같으면 304로 답하는 가짜 contents API"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    files = ["1.txt", "2.txt", "README.md"]
+    etag = '"v1"'
+    down = False
+    # 받은 요청의 If-None-Match 헤더 (없으면 None)
+    seen = []
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        with self.lock:
+            cls.seen.append(self.headers.get("If-None-Match"))
+        if cls.down:
+            self._reply(503, b"")
+        elif self.headers.get("If-None-Match") == cls.etag:
+            self._reply(304, b"")
+        else:
+            body = json.dumps([{"name": name, "type": "file"} for name in cls.files]).encode()
+            self._reply(200, body, ("ETag", cls.etag), ("Content-Type", "application/json"))
+
+    def _reply(self, status, body, *headers):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandInGitHub)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, name="stand-in-github", daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def github(server, monkeypatch):
+    """빈 목록 캐시와 새 공용 세션으로 가짜 API를 바라보게 한다"""
+    monkeypatch.setattr(item_bank, "API_BASE_URL", server)
+    monkeypatch.setattr(item_bank, "LISTING_TTL", 60.0)
+    monkeypatch.setattr(item_bank, "_LISTINGS", {})
+    monkeypatch.setattr(item_bank, "_LISTING_STATS", dict.fromkeys(item_bank._LISTING_STATS, 0))
+    monkeypatch.setattr(http_client, "MAX_RETRIES", 0)
+    monkeypatch.setattr(http_client, "_session", None)
+    monkeypatch.setattr(http_client, "_HISTOGRAMS", {})
+    monkeypatch.setattr(http_client, "_SLOTS", {})
+    StandInGitHub.files = ["1.txt", "2.txt", "README.md"]
+    StandInGitHub.etag = '"v1"'
+    StandInGitHub.down = False
+    StandInGitHub.seen = []
+    return StandInGitHub
+
+
+def fetch():
+    return item_bank.fetch_github_file_list(*KEY)
+
+
+def expire():
+    """다음 호출이 재검증하도록 캐시 항목의 만료 시각을 지난 시각으로 바꾼다"""
+    _, etag, files = item_bank._LISTINGS[KEY]
+    item_bank._LISTINGS[KEY] = (0.0, etag, files)
+
+
+def test_listing_keeps_only_item_files(github):
+    assert fetch() == ["1.txt", "2.txt"]
+    assert item_bank._LISTINGS[KEY][1] == '"v1"'
+
+
+def test_listing_is_served_from_cache_within_ttl(github):
+    first = fetch()
+    for _ in range(3):
+        assert fetch() == first
+    assert github.seen == [None]
+    stats = item_bank.listing_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 3
+
+
+def test_expired_listing_is_revalidated_with_etag(github):
+    fetch()
+    expire()
+    github.files = ["1.txt", "2.txt", "3.txt"]  # ETag가 같으면 서버는 목록을 보내지 않는다
+    assert fetch() == ["1.txt", "2.txt"]
+    assert github.seen == [None, '"v1"']
+    assert item_bank.listing_stats()["not_modified"] == 1
+    # 재검증한 목록은 TTL 동안 다시 캐시에서 나온다
+    assert fetch() == ["1.txt", "2.txt"]
+    assert len(github.seen) == 2
+
+
+def test_changed_etag_replaces_listing(github):
+    fetch()
+    expire()
+    github.files = ["1.txt", "2.txt", "3.txt"]
+    github.etag = '"v2"'
+    assert fetch() == ["1.txt", "2.txt", "3.txt"]
+    assert item_bank._LISTINGS[KEY][1] == '"v2"'
+
+
+def test_error_serves_stale_listing_and_extends_ttl(github):
+    fetch()
+    expire()
+    github.down = True
+    assert fetch() == ["1.txt", "2.txt"]
+    stats = item_bank.listing_stats()
+    assert stats["errors"] == 1
+    assert stats["stale"] == 1
+    # 장애 중에도 유효 시간을 연장했으므로 다음 호출은 API를 부르지 않는다
+    assert fetch() == ["1.txt", "2.txt"]
+    assert len(github.seen) == 2
+    assert item_bank._LISTINGS[KEY][1] == '"v1"'
+
+
+def test_error_without_cache_returns_empty_list(github):
+    github.down = True
+    assert fetch() == []
+    assert KEY not in item_bank._LISTINGS
+    stats = item_bank.listing_stats()
+    assert stats["errors"] == 1
+    assert stats["stale"] == 0
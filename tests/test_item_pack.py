@@ -0,0 +1,102 @@
+"""item_pack: 임시 data/ 폴더로 묶음 파일을 만들고 ItemPack으로 다시 읽어 메타데이터, 본문, 이미지가 같은지 확인한다
+
+    python -m pytest tests/
+"""
+import json
+import os
+import struct
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import item_pack  # noqa: E402
+
+# 폴더 -> {파일 이름: (파일 내용, 인코딩)}
+ITEMS = {
+    "data/grade": {
+        "1.txt": ("1\n3\n10\n7\n8\n첫째 문단입니다.\n둘째 문단입니다.\n", "cp949"),
+        "2.txt": ("2\n5\n12\n6\n7\n  앞뒤 공백은 지운다  \n", "utf-8"),
+    },
+    "data/scre": {
+        "11.txt": ("11\n2\n9\n9\n5\n점수 모드 문항 본문\n", "cp949"),
+        "notes.md": ("문항이 아닌 파일\n", "utf-8"),
+    },
+}
+IMAGES = {
+    "data/f_grade": {"1.png": b"\x89PNG\r\n\x1a\nfake-1"},
+    "data/f_score": {"11.png": b"\x89PNG\r\n\x1a\nfake-11", "11.jpg": b"\xff\xd8\xff"},
+}
+
+
+@pytest.fixture
+def root(tmp_path):
+    for folder, files in ITEMS.items():
+        os.makedirs(tmp_path / folder)
+        for name, (text, encoding) in files.items():
+            (tmp_path / folder / name).write_bytes(text.encode(encoding))
+    for folder, files in IMAGES.items():
+        os.makedirs(tmp_path / folder)
+        for name, data in files.items():
+            (tmp_path / folder / name).write_bytes(data)
+    return tmp_path
+
+
+@pytest.fixture
+def pack(root, tmp_path):
+    path = str(tmp_path / "items.pack")
+    assert item_pack.build_pack(path, str(root)) == 3
+    return item_pack.open_pack(path)
+
+
+def test_names_keep_only_item_files(pack):
+    assert pack.names("data/grade") == ["1.txt", "2.txt"]
+    assert pack.names("data/scre") == ["11.txt"]
+    assert pack.names("data/missing") == []
+    assert pack.has_folder("data/grade")
+    assert not pack.has_folder("data/missing")
+
+
+def test_meta_text_and_record_round_trip(pack):
+    assert pack.meta("data/grade", "1.txt") == ("1.txt", "1", 3, 10, 7, 8)
+    assert pack.text("data/grade", "1.txt") == "첫째 문단입니다.\n둘째 문단입니다."
+    assert pack.text("data/grade", "2.txt") == "앞뒤 공백은 지운다"
+    assert pack.record("data/scre", "11.txt") == ("11.txt", "11", 2, 9, 9, 5, "점수 모드 문항 본문")
+
+
+def test_unknown_item_raises_key_error(pack):
+    with pytest.raises(KeyError):
+        pack.meta("data/grade", "9.txt")
+
+
+def test_images_round_trip(pack):
+    for folder, files in IMAGES.items():
+        for name, data in files.items():
+            assert pack.image(f"{folder}/{name}") == data
+    assert pack.image("data/f_grade/2.png") is None
+
+
+def test_missing_pack_opens_as_none(tmp_path):
+    assert item_pack.open_pack(str(tmp_path / "none.pack")) is None
+
+
+def write_raw(path, magic, header):
+    header_bytes = json.dumps(header).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(struct.pack("<8sI", magic, len(header_bytes)))
+        f.write(header_bytes)
+
+
+def test_bad_magic_is_rejected(tmp_path):
+    path = str(tmp_path / "bad.pack")
+    write_raw(path, b"NOTAPACK", {"version": item_pack.VERSION, "folders": {}, "images": {}})
+    with pytest.raises(ValueError):
+        item_pack.ItemPack(path)
+
+
+def test_old_version_is_rejected(tmp_path):
+    path = str(tmp_path / "old.pack")
+    write_raw(path, item_pack.MAGIC, {"version": item_pack.VERSION - 1, "folders": {}, "images": {}})
+    with pytest.raises(ValueError):
+        item_pack.ItemPack(path)
@@ -0,0 +1,107 @@
+"""response_log: 묶음마다 갱신한 합계 표가 원본 기록에서 다시 만든 합계 표와 같은지 확인한다
+
+    python -m pytest tests/
+"""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import response_log  # noqa: E402
+
+TABLES = {
+    "item_totals": "mode, qnum",
+    "dimension_totals": "mode, qnum, dimension",
+    "trainee_totals": "mode, user_name, day",
+    "confusion_totals": "mode, answer, response",
+}
+
+
+def make_rows(n, seed=0):
+    """등급(영역 1개)과 점수(영역 3개) 모드가 섞인 기록 n건 (여러 날짜, 응답 시간 없는 기록 포함)"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        mode = rng.choice(("grade", "score"))
+        dims = 1 if mode == "grade" else 3
+        answer = tuple(rng.randint(1, 5) for _ in range(dims))
+        response = tuple(a if rng.random() < 0.5 else rng.randint(1, 5) for a in answer)
+        hits = tuple(a == r for a, r in zip(answer, response))
+        rows.append((
+            1_760_000_000 + i * 3600.0,
+            rng.choice(("kim", "lee", "park")),
+            mode,
+            str(rng.randint(1, 15)),
+            answer,
+            response,
+            hits,
+            int(all(hits)),
+            # 2진수로 정확한 값이라 더하는 순서와 상관없이 합계가 같다
+            None if rng.random() < 0.1 else rng.randint(1, 400) * 0.25,
+        ))
+    return rows
+
+
+def snapshot(conn):
+    return {
+        table: conn.execute(f"SELECT * FROM {table} ORDER BY {key}").fetchall()
+        for table, key in TABLES.items()
+    }
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = response_log.connect(str(tmp_path / "responses.sqlite3"))
+    yield conn
+    conn.close()
+
+
+def test_incremental_totals_match_rebuild(conn):
+    rows = make_rows(600)
+    # 크기가 제각각인 묶음으로 나눠 쓴다 (같은 키가 여러 묶음에 걸친다)
+    start = 0
+    for size in (1, 7, 50, 142, 400):
+        response_log._write(conn, rows[start:start + size])
+        start += size
+    assert start == len(rows)
+    incremental = snapshot(conn)
+    assert all(incremental.values())
+
+    response_log.rebuild_aggregates(conn)
+    assert snapshot(conn) == incremental
+
+
+def test_totals_count_every_row(conn):
+    rows = make_rows(200, seed=1)
+    response_log._write(conn, rows[:100])
+    response_log._write(conn, rows[100:])
+    (count, correct), = conn.execute("SELECT SUM(count), SUM(correct) FROM item_totals").fetchall()
+    assert count == len(rows)
+    assert correct == sum(row[7] for row in rows)
+    (trainee_count,), = conn.execute("SELECT SUM(count) FROM trainee_totals").fetchall()
+    assert trainee_count == len(rows)
+    (confusion_count,), = conn.execute("SELECT SUM(count) FROM confusion_totals").fetchall()
+    assert confusion_count == sum(1 for row in rows if row[2] == "grade")
+    (dimension_count,), = conn.execute("SELECT SUM(count) FROM dimension_totals").fetchall()
+    assert dimension_count == sum(len(row[4]) for row in rows)
+
+
+def test_rebuild_runs_on_version_change(tmp_path):
+    path = str(tmp_path / "responses.sqlite3")
+    conn = response_log.connect(path)
+    response_log._write(conn, make_rows(50, seed=2))
+    expected = snapshot(conn)
+    conn.execute("DELETE FROM item_totals")
+    conn.execute("PRAGMA user_version = 0")
+    conn.commit()
+    conn.close()
+
+    conn = response_log.connect(path)
+    try:
+        assert snapshot(conn) == expected
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == response_log.AGGREGATE_VERSION
+    finally:
+        conn.close()
@@ -0,0 +1,51 @@
+"""results: 결과 레코드의 정답 여부와 걸린 시간, ResultStore의 중복 제거와 정답 수
+
+    python -m pytest tests/
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from results import ResultRecord, ResultStore  # noqa: E402
+
+
+def record(qnum, answer, response, started_at=100.0, submitted_at=112.5):
+    hits = tuple(a == r for a, r in zip(answer, response))
+    return ResultRecord(qnum, answer, response, hits, started_at, submitted_at)
+
+
+def test_record_correct_needs_every_dimension():
+    assert record("1", (3,), (3,)).correct
+    assert record("2", (10, 7, 8), (10, 7, 8)).correct
+    assert not record("3", (10, 7, 8), (10, 6, 8)).correct
+
+
+def test_record_elapsed():
+    assert record("1", (3,), (3,), started_at=50.0, submitted_at=80.25).elapsed == 30.25
+
+
+def test_store_counts_correct_answers():
+    store = ResultStore()
+    assert store.accuracy() == 0.0
+    assert store.add(record("1", (3,), (3,)))
+    assert store.add(record("2", (4,), (2,)))
+    assert store.add(record("3", (1,), (1,)))
+    assert store.add(record("4", (5,), (4,)))
+    assert len(store) == 4
+    assert store.correct_count == 2
+    assert store.accuracy() == 50.0
+    assert [r.qnum for r in store] == ["1", "2", "3", "4"]
+
+
+def test_store_ignores_repeated_qnum():
+    store = ResultStore()
+    assert store.add(record("7", (3,), (3,)))
+    # 같은 문항을 다시 제출해도 (예: 제출 버튼을 두 번 누른 경우) 처음 결과만 남는다
+    assert not store.add(record("7", (3,), (1,)))
+    assert not store.add(record("7", (3,), (3,)))
+    assert len(store) == 1
+    assert store.correct_count == 1
+    assert "7" in store
+    assert "8" not in store
+    assert list(store)[0].response == (3,)
@@ -0,0 +1,273 @@
+"""실행 구간 추적: 스크립트 실행마다 화면 함수, 원격 호출, 파싱에 걸린 시간을 중첩 구간으로 기록한다
+
+SEP_ME_TRACING=1일 때만 켜진다. 꺼져 있으면 traced는 함수를 그대로 돌려주고
+span은 아무것도 하지 않는 컨텍스트 하나를 돌려주므로 추가 비용이 거의 없다.
+
+    @traced
+    def practice_screen(mode): ...
+
+    with span("dispatch"):
+        ...
+
+- 최근 실행: 루트 구간이 "run"인 실행(스크립트 실행 한 번)의 구간 트리를 최근 RECENT_TRACES개 보관
+- 최근 분포: 구간 이름별 지연 시간 히스토그램을 SLOT_SECONDS 단위로 WINDOW_SLOTS개만 유지
+- 누적 분포: 프로세스 시작 후 전체 히스토그램 (Prometheus 텍스트 형식으로 내보냄)
+"""
+import contextlib
+import functools
+import http.server
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.environ.get("SEP_ME_TRACING", "0") not in ("", "0")
+# Prometheus 텍스트 형식 /metrics 주소 (포트 0이면 열지 않음)
+METRICS_HOST = os.environ.get("SEP_ME_METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.environ.get("SEP_ME_METRICS_PORT", "0"))
+
+ROOT_SPAN = "run"
+RECENT_TRACES = 20
+SLOT_SECONDS = 60
+WINDOW_SLOTS = 5
+# 구간 지연 시간 히스토그램 구간 상한(초)
+SPAN_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_LOCK = threading.Lock()
+# 구간 이름 -> [구간별 개수(마지막은 +Inf), 횟수, 합계(초)]
+_TOTALS = {}
+# [(슬롯 번호, {구간 이름: [구간별 개수, 횟수, 합계]}), ...] 오래된 것부터
+_WINDOW = deque()
+# (시작 시각, [(깊이, 구간 이름, 걸린 시간(초)), ...]) 최근 것이 끝에
+_TRACES = deque(maxlen=RECENT_TRACES)
+_NOOP = contextlib.nullcontext()
+_metrics_server = None
+
+
+class _ThreadState(threading.local):
+    def __init__(self):
+        self.depth = 0
+        self.entries = []
+        self.started_at = 0.0
+
+
+_state = _ThreadState()
+
+
+def _new_hist():
+    return [[0] * (len(SPAN_BUCKETS) + 1), 0, 0.0]
+
+
+def _add(hist, i, elapsed):
+    hist[0][i] += 1
+    hist[1] += 1
+    hist[2] += elapsed
+
+
+def _observe(name, elapsed):
+    for i, bound in enumerate(SPAN_BUCKETS):
+        if elapsed <= bound:
+            break
+    else:
+        i = len(SPAN_BUCKETS)
+    slot = int(time.time() // SLOT_SECONDS)
+    with _LOCK:
+        hist = _TOTALS.get(name)
+        if hist is None:
+            hist = _TOTALS[name] = _new_hist()
+        _add(hist, i, elapsed)
+        if not _WINDOW or _WINDOW[-1][0] != slot:
+            _WINDOW.append((slot, {}))
+            while _WINDOW[0][0] <= slot - WINDOW_SLOTS:
+                _WINDOW.popleft()
+        hists = _WINDOW[-1][1]
+        hist = hists.get(name)
+        if hist is None:
+            hist = hists[name] = _new_hist()
+        _add(hist, i, elapsed)
+
+
+class _Span:
+    __slots__ = ("name", "entry", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        state = _state
+        if state.depth == 0:
+            state.entries = []
+            state.started_at = time.time()
+        self.entry = [state.depth, self.name, None]
+        state.entries.append(self.entry)
+        state.depth += 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        state = _state
+        self.entry[2] = elapsed
+        state.depth -= 1
+        _observe(self.name, elapsed)
+        if state.depth == 0 and self.name == ROOT_SPAN:
+            trace = (state.started_at, [tuple(entry) for entry in state.entries])
+            with _LOCK:
+                _TRACES.append(trace)
+        return False
+
+
+def span(name):
+    """이름 붙인 구간 (꺼져 있으면 아무것도 하지 않는다)"""
+    if not ENABLED:
+        return _NOOP
+    return _Span(name)
+
+
+def traced(func):
+    """함수 전체를 함수 이름의 구간으로 기록하는 데코레이터 (꺼져 있으면 함수를 그대로 돌려준다)"""
+    if not ENABLED:
+        return func
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _Span(name):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _quantile(buckets, count, q):
+    """히스토그램에서 q 분위가 들어 있는 구간의 상한(초, +Inf 구간이면 inf)"""
+    target = q * count
+    seen = 0
+    for bound, n in zip(SPAN_BUCKETS + (float("inf"),), buckets):
+        seen += n
+        if seen >= target:
+            return bound
+    return float("inf")
+
+
+def span_summary():
+    """최근 WINDOW_SLOTS × SLOT_SECONDS초 동안 구간 이름별 (횟수, 평균, p50, p95, p99) (초)"""
+    oldest = int(time.time() // SLOT_SECONDS) - WINDOW_SLOTS + 1
+    merged = {}
+    with _LOCK:
+        for slot, hists in _WINDOW:
+            if slot < oldest:
+                continue
+            for name, (buckets, count, total) in hists.items():
+                hist = merged.get(name)
+                if hist is None:
+                    hist = merged[name] = _new_hist()
+                hist[0] = [a + b for a, b in zip(hist[0], buckets)]
+                hist[1] += count
+                hist[2] += total
+    return {
+        name: {
+            "count": count,
+            "mean": total / count,
+            "p50": _quantile(buckets, count, 0.5),
+            "p95": _quantile(buckets, count, 0.95),
+            "p99": _quantile(buckets, count, 0.99),
+        }
+        for name, (buckets, count, total) in sorted(merged.items())
+    }
+
+
+def recent_traces():
+    """최근 스크립트 실행의 구간 트리 목록 (최근 것부터)"""
+    with _LOCK:
+        return list(reversed(_TRACES))
+
+
+def _histogram_lines(metric, label, bounds, hists):
+    """{라벨 값: (구간별 개수, 횟수, 합계)}를 누적 구간(le) 히스토그램 줄로"""
+    lines = []
+    for key, (buckets, count, total) in sorted(hists.items()):
+        seen = 0
+        for bound, n in zip(bounds + (float("inf"),), buckets):
+            seen += n
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{metric}_bucket{{{label}="{key}",le="{le}"}} {seen}')
+        lines.append(f'{metric}_sum{{{label}="{key}"}} {total!r}')
+        lines.append(f'{metric}_count{{{label}="{key}"}} {count}')
+    return lines
+
+
+def prometheus_text():
+    """누적 구간 히스토그램, 원격 호출 히스토그램, 세션 상태 크기 (Prometheus 텍스트 형식 0.0.4)"""
+    import http_client
+
+    with _LOCK:
+        spans = {name: (list(b), c, s) for name, (b, c, s) in _TOTALS.items()}
+    http_hists = http_client.latency_histograms()
+    lines = [
+        "# HELP sep_me_span_seconds 실행 구간별 걸린 시간",
+        "# TYPE sep_me_span_seconds histogram",
+    ]
+    lines += _histogram_lines("sep_me_span_seconds", "span", SPAN_BUCKETS, spans)
+    lines += [
+        "# HELP sep_me_http_request_seconds 원격 호출 호스트별 지연 시간",
+        "# TYPE sep_me_http_request_seconds histogram",
+    ]
+    lines += _histogram_lines(
+        "sep_me_http_request_seconds", "host", http_client.LATENCY_BUCKETS,
+        {host: (h["buckets"], h["count"], h["sum"]) for host, h in http_hists.items()},
+    )
+    lines += [
+        "# HELP sep_me_http_errors_total 실패한 원격 호출 수",
+        "# TYPE sep_me_http_errors_total counter",
+    ]
+    for host, hist in sorted(http_hists.items()):
+        lines.append(f'sep_me_http_errors_total{{host="{host}"}} {hist["errors"]}')
+
+    import session_size
+
+    sizes = session_size.size_summary()
+    lines += [
+        "# HELP sep_me_sessions 최근 실행된 세션 수",
+        "# TYPE sep_me_sessions gauge",
+        f"sep_me_sessions {sizes['sessions']}",
+        "# HELP sep_me_session_state_bytes 세션 상태 크기(바이트, 공유 객체 제외)",
+        "# TYPE sep_me_session_state_bytes gauge",
+    ]
+    for stat in ("total", "mean", "max"):
+        lines.append(f'sep_me_session_state_bytes{{stat="{stat}"}} {sizes[stat]}')
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def ensure_metrics_server():
+    """켜져 있고 포트가 설정돼 있으면 /metrics 서버 스레드를 한 번 띄운다"""
+    global _metrics_server
+    if not ENABLED or not METRICS_PORT or _metrics_server is not None:
+        return
+    with _LOCK:
+        if _metrics_server is not None:
+            return
+        try:
+            _metrics_server = http.server.ThreadingHTTPServer((METRICS_HOST, METRICS_PORT), _MetricsHandler)
+        except OSError as e:
+            logger.warning("메트릭 서버를 열 수 없습니다 (%s:%d): %s", METRICS_HOST, METRICS_PORT, e)
+            _metrics_server = False
+            return
+        threading.Thread(target=_metrics_server.serve_forever, name="metrics", daemon=True).start()